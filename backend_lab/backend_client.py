@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import http.client
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
-from urllib import error, parse, request
+from urllib import parse
+
+try:  # pragma: no cover - optional faster JSON decoding
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 class BackendRequestError(RuntimeError):
@@ -15,6 +21,60 @@ class BackendHttpClient:
     api_url: str
     es_url: str
     timeout_seconds: float = 30.0
+    _connections: dict[tuple[str, str], http.client.HTTPConnection] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def _connection(self, parts: parse.SplitResult) -> http.client.HTTPConnection:
+        key = (parts.scheme, parts.netloc)
+        connection = self._connections.get(key)
+        if connection is None:
+            connection_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            connection = connection_cls(parts.netloc, timeout=self.timeout_seconds)
+            self._connections[key] = connection
+        return connection
+
+    def _drop_connection(self, parts: parse.SplitResult) -> None:
+        connection = self._connections.pop((parts.scheme, parts.netloc), None)
+        if connection is not None:
+            connection.close()
+
+    def close(self) -> None:
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+
+    def _http_request(
+        self,
+        *,
+        url: str,
+        method: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[int, bytes]:
+        parts = parse.urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        for attempt in range(2):
+            connection = self._connection(parts)
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                response = connection.getresponse()
+                return int(response.status), response.read()
+            except TimeoutError as exc:
+                self._drop_connection(parts)
+                raise BackendRequestError(f"Request timed out for {url}") from exc
+            except (http.client.HTTPException, OSError) as exc:
+                # Keep-alive sockets can be closed by the server between requests; retry once on a fresh one.
+                self._drop_connection(parts)
+                if attempt == 0 and isinstance(exc, (http.client.RemoteDisconnected, ConnectionError)):
+                    continue
+                raise BackendRequestError(f"Request failed for {url}: {exc}") from exc
+        raise BackendRequestError(f"Request failed for {url}")  # pragma: no cover
 
     def _request_json(
         self,
@@ -28,22 +88,21 @@ class BackendHttpClient:
         if payload is not None:
             body = json.dumps(payload).encode("utf-8")
             headers["Content-Type"] = "application/json"
-        req = request.Request(url=url, method=method, data=body, headers=headers)
-        try:
-            with request.urlopen(req, timeout=self.timeout_seconds) as response:
-                raw = response.read().decode("utf-8")
-        except error.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="replace")
-            raise BackendRequestError(f"HTTP {exc.code} for {url}: {detail}") from exc
-        except TimeoutError as exc:
-            raise BackendRequestError(f"Request timed out for {url}") from exc
-        except error.URLError as exc:
-            raise BackendRequestError(f"Request failed for {url}: {exc}") from exc
-
-        if not raw.strip():
+        status, raw_bytes = self._http_request(url=url, method=method, body=body, headers=headers)
+        if status >= 400:
+            detail = raw_bytes.decode("utf-8", errors="replace")
+            raise BackendRequestError(f"HTTP {status} for {url}: {detail}")
+
+        if not raw_bytes.strip():
             return {}
+        if orjson is not None:
+            try:
+                return orjson.loads(raw_bytes)
+            except orjson.JSONDecodeError:
+                # Fall back so NaN and other stdlib-only inputs keep decoding.
+                pass
         try:
-            return json.loads(raw)
+            return json.loads(raw_bytes.decode("utf-8"))
         except json.JSONDecodeError as exc:
             raise BackendRequestError(f"Response was not valid JSON for {url}") from exc
 
@@ -1437,6 +1437,8 @@ def main(argv: list[str] | None = None) -> int:
     ) as exc:
         _print_json({"error": str(exc)})
         return 1
+    finally:
+        client.close()
 
     parser.error(f"Unknown command: {args.command}")
     return 2
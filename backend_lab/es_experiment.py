@@ -685,14 +685,13 @@ def _table_profile_summary(preprocessing_schema: dict[str, Any], col_id: int | N
 def _classify_candidate_family(
     *,
     label: str,
-    description: str,
+    label_description_tokens: set[str],
     context_string: str,
     expected_context_tokens: set[str],
     coarse_type: str,
     item_category: str,
 ) -> tuple[str, float]:
     label_lower = label.casefold()
-    label_description_tokens = set(_tokenize(" ".join(part for part in (label, description) if part)))
 
     if label_lower.startswith("category:") or {"wikimedia", "category"} <= label_description_tokens:
         return "META_CATEGORY", 4.5
@@ -879,21 +878,69 @@ def _apply_same_type_ambiguity_resolver(candidates: list[dict[str, Any]]) -> lis
     return candidates
 
 
+@dataclass(frozen=True, slots=True)
+class _QueryFeatureInputs:
+    mention_norm: str
+    family: str
+    column_role: str
+    coarse_hints: Any
+    fine_hints: Any
+    item_category_filters: Any
+    context_weight_tokens: tuple[tuple[tuple[str, ...], float], ...]
+    expected_descriptor_tokens: frozenset[str]
+    expected_context_tokens: frozenset[str]
+    mention_tokens: frozenset[str]
+    mention_content_tokens: frozenset[str]
+
+
+def _query_feature_inputs(
+    *,
+    lookup_payload: dict[str, Any],
+    preprocessing_schema: dict[str, Any],
+) -> _QueryFeatureInputs:
+    mention = lookup_payload.get("mention", "")
+    context = preprocessing_schema.get("context", {})
+    col_id = context.get("col_id") if isinstance(context, dict) else None
+    family, column_role = _table_profile_summary(preprocessing_schema, col_id if isinstance(col_id, int) else None)
+    context_weight_tokens: list[tuple[tuple[str, ...], float]] = []
+    for normalized_value, weight in _extract_soft_context_weights(preprocessing_schema).items():
+        tokens = tuple(token for token in _tokenize(normalized_value) if token)
+        if tokens:
+            context_weight_tokens.append((tokens, float(weight)))
+    return _QueryFeatureInputs(
+        mention_norm=_normalize_text(mention) if isinstance(mention, str) else "",
+        family=family,
+        column_role=column_role,
+        coarse_hints=lookup_payload.get("coarse_hints", []),
+        fine_hints=lookup_payload.get("fine_hints", []),
+        item_category_filters=lookup_payload.get("item_category_filters", []),
+        context_weight_tokens=tuple(context_weight_tokens),
+        expected_descriptor_tokens=frozenset(_expected_descriptor_tokens(preprocessing_schema, lookup_payload)),
+        expected_context_tokens=frozenset(_expected_context_tokens(preprocessing_schema, lookup_payload)),
+        mention_tokens=frozenset(_tokenize(mention)),
+        mention_content_tokens=frozenset(_content_token_set(mention)) if isinstance(mention, str) else frozenset(),
+    )
+
+
 def extract_candidate_features(
     *,
     hit: dict[str, Any],
     lookup_payload: dict[str, Any],
     preprocessing_schema: dict[str, Any],
+    query_inputs: _QueryFeatureInputs | None = None,
 ) -> CandidateFeatures:
     source = hit.get("_source", {})
     if not isinstance(source, dict):
         source = {}
 
-    mention = lookup_payload.get("mention", "")
-    context = preprocessing_schema.get("context", {})
-    col_id = context.get("col_id") if isinstance(context, dict) else None
-    family, column_role = _table_profile_summary(preprocessing_schema, col_id if isinstance(col_id, int) else None)
-    mention_norm = _normalize_text(mention) if isinstance(mention, str) else ""
+    if query_inputs is None:
+        query_inputs = _query_feature_inputs(
+            lookup_payload=lookup_payload,
+            preprocessing_schema=preprocessing_schema,
+        )
+    family = query_inputs.family
+    column_role = query_inputs.column_role
+    mention_norm = query_inputs.mention_norm
     label = source.get("label") if isinstance(source.get("label"), str) else ""
     label_norm = _normalize_text(label)
     aliases = source.get("aliases") if isinstance(source.get("aliases"), list) else []
@@ -908,9 +955,9 @@ def extract_candidate_features(
     )
     best_name_similarity = max(label_similarity, alias_similarity)
 
-    coarse_hints = lookup_payload.get("coarse_hints", [])
-    fine_hints = lookup_payload.get("fine_hints", [])
-    item_category_filters = lookup_payload.get("item_category_filters", [])
+    coarse_hints = query_inputs.coarse_hints
+    fine_hints = query_inputs.fine_hints
+    item_category_filters = query_inputs.item_category_filters
     candidate_coarse = source.get("coarse_type") if isinstance(source.get("coarse_type"), str) else ""
     candidate_fine = source.get("fine_type") if isinstance(source.get("fine_type"), str) else ""
     candidate_item = source.get("item_category") if isinstance(source.get("item_category"), str) else ""
@@ -918,21 +965,20 @@ def extract_candidate_features(
     fine_match = candidate_fine in fine_hints if isinstance(fine_hints, list) else False
     item_category_match = candidate_item in item_category_filters if isinstance(item_category_filters, list) else False
 
-    context_weights = _extract_soft_context_weights(preprocessing_schema)
     context_string = source.get("context_string") if isinstance(source.get("context_string"), str) else ""
     description = source.get("description") if isinstance(source.get("description"), str) else ""
-    context_tokens = set(_tokenize(context_string))
-    description_tokens = set(_tokenize(description))
-    candidate_tokens = context_tokens | description_tokens | set(_tokenize(label))
+    # Tokenize each field once; empty context/description are common for pass1-only rows.
+    context_tokens = set(_tokenize(context_string)) if context_string else set()
+    description_tokens = set(_tokenize(description)) if description else set()
+    label_tokens = set(_tokenize(label)) if label else set()
+    label_description_tokens = label_tokens | description_tokens
+    candidate_tokens = context_tokens | label_description_tokens
     overlap_count = 0
     weighted_overlap = 0.0
-    for normalized_value, weight in context_weights.items():
-        tokens = [token for token in _tokenize(normalized_value) if token]
-        if not tokens:
-            continue
+    for tokens, weight in query_inputs.context_weight_tokens:
         if all(token in context_tokens for token in tokens):
             overlap_count += 1
-            weighted_overlap += float(weight)
+            weighted_overlap += weight
 
     prior = 0.0
     raw_prior = source.get("prior")
@@ -942,14 +988,13 @@ def extract_candidate_features(
     es_score = float(raw_score) if isinstance(raw_score, (int, float)) else 0.0
     has_wikipedia = bool(source.get("wikipedia_url"))
 
-    expected_descriptor_tokens = _expected_descriptor_tokens(preprocessing_schema, lookup_payload)
-    expected_context_tokens = _expected_context_tokens(preprocessing_schema, lookup_payload)
+    expected_descriptor_tokens = query_inputs.expected_descriptor_tokens
+    expected_context_tokens = query_inputs.expected_context_tokens
     expected_descriptor_overlap = len(expected_descriptor_tokens & candidate_tokens)
     meta_token_overlap = len(_META_ENTITY_TOKENS & candidate_tokens)
     off_domain_token_overlap = len(_OFF_DOMAIN_TOKENS & candidate_tokens)
-    mention_tokens = set(_tokenize(mention))
-    label_tokens = set(_tokenize(label))
-    mention_content_tokens = _content_token_set(mention) if isinstance(mention, str) else set()
+    mention_tokens = query_inputs.mention_tokens
+    mention_content_tokens = query_inputs.mention_content_tokens
     label_content_tokens = _content_token_set(label)
     mention_token_coverage = (
         len(mention_content_tokens & label_content_tokens) / len(mention_content_tokens)
@@ -963,7 +1008,7 @@ def extract_candidate_features(
     extra_label_off_domain_overlap = len(_OFF_DOMAIN_TOKENS & extra_label_tokens)
     candidate_family, family_penalty = _classify_candidate_family(
         label=label,
-        description=description,
+        label_description_tokens=label_description_tokens,
         context_string=context_string,
         expected_context_tokens=expected_context_tokens,
         coarse_type=candidate_coarse,
@@ -1145,6 +1190,24 @@ def extract_candidate_features(
     )
 
 
+def _best_hit_index_by_qid(hits: list[Any]) -> dict[str, int]:
+    # Keep only the highest-scoring copy of each QID so duplicates are not featurized twice.
+    best: dict[str, tuple[int, float]] = {}
+    for index, hit in enumerate(hits):
+        if not isinstance(hit, dict):
+            continue
+        source = hit.get("_source")
+        qid = source.get("qid") if isinstance(source, dict) else None
+        if not isinstance(qid, str) or not qid:
+            continue
+        raw_score = hit.get("_score")
+        score = float(raw_score) if isinstance(raw_score, (int, float)) else 0.0
+        current = best.get(qid)
+        if current is None or score > current[1]:
+            best[qid] = (index, score)
+    return {qid: index for qid, (index, _) in best.items()}
+
+
 def rerank_es_hits(
     *,
     es_result: dict[str, Any],
@@ -1155,16 +1218,25 @@ def rerank_es_hits(
     if not isinstance(hits, list):
         return []
     candidates: list[dict[str, Any]] = []
+    query_inputs = _query_feature_inputs(
+        lookup_payload=lookup_payload,
+        preprocessing_schema=preprocessing_schema,
+    )
+    best_hit_by_qid = _best_hit_index_by_qid(hits)
     for rank, hit in enumerate(hits, start=1):
         if not isinstance(hit, dict):
             continue
         source = hit.get("_source", {})
         if not isinstance(source, dict):
             continue
+        qid = source.get("qid")
+        if isinstance(qid, str) and best_hit_by_qid.get(qid, rank - 1) != rank - 1:
+            continue
         features = extract_candidate_features(
             hit=hit,
             lookup_payload=lookup_payload,
             preprocessing_schema=preprocessing_schema,
+            query_inputs=query_inputs,
         )
         candidates.append(
             {
@@ -5,6 +5,7 @@ import json
 import re
 import sqlite3
 import sys
+import zlib
 from collections import OrderedDict
 from collections.abc import Mapping, Sequence
 from pathlib import Path
@@ -36,6 +37,7 @@ from .common import (
     tokenize,
     tqdm,
 )
+from .build_labels_db import load_labels_json, open_labels_db
 
 SELECT_LABELS_SQL = "SELECT labels_json FROM labels WHERE id = ?"
 _VALID_NER_TYPE_RE = re.compile(r"^[A-Za-z0-9_.:/-]+$")
@@ -168,10 +170,10 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def decode_payload(raw_json: str) -> dict[str, Any] | None:
+def decode_payload(raw_payload: str | bytes) -> dict[str, Any] | None:
     try:
-        parsed = json.loads(raw_json)
-    except json.JSONDecodeError:
+        parsed = load_labels_json(raw_payload)
+    except (json.JSONDecodeError, UnicodeDecodeError, zlib.error):
         return None
 
     if not isinstance(parsed, dict):
@@ -233,18 +235,18 @@ def _append_tokens_from_text(
     stopwords: set[str],
     max_tokens: int,
 ) -> None:
-    if len(token_buffer) >= max_tokens:
+    remaining = max_tokens - len(token_buffer)
+    if remaining <= 0:
         return
 
     for token in tokenize(text):
-        if len(token_buffer) >= max_tokens:
-            return
-        if len(token) <= 1 or token in stopwords:
-            continue
-        if token in seen_tokens:
+        if len(token) <= 1 or token in stopwords or token in seen_tokens:
             continue
         seen_tokens.add(token)
         token_buffer.append(token)
+        remaining -= 1
+        if remaining <= 0:
+            return
 
 
 def _pick_preferred_label(labels: Mapping[str, str]) -> str:
@@ -376,7 +378,7 @@ class ObjectLabelResolver:
             for row in self._cursor.fetchall():
                 entity_id = row[0] if len(row) > 0 else None
                 raw_payload = row[1] if len(row) > 1 else None
-                if not isinstance(entity_id, str) or not isinstance(raw_payload, str):
+                if not isinstance(entity_id, str) or not isinstance(raw_payload, (str, bytes)):
                     continue
                 payload = decode_payload(raw_payload)
                 if payload is None:
@@ -729,7 +731,7 @@ def run(
     max_observed_doc_bytes = 0
     write_buffer: list[str] = []
 
-    conn = sqlite3.connect(labels_db_path)
+    conn = open_labels_db(labels_db_path)
     try:
         cursor = conn.cursor()
         object_label_resolver = ObjectLabelResolver(
@@ -765,7 +767,7 @@ def run(
                         continue
 
                     raw_payload = row[0]
-                    if not isinstance(raw_payload, str):
+                    if not isinstance(raw_payload, (str, bytes)):
                         missing_in_db += 1
                         continue
 
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import sqlite3
 import sys
-from collections.abc import Mapping, Sequence
+import zlib
+from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from .common import (
     DUMP_PATH_ENV,
@@ -17,6 +23,7 @@ from .common import (
     extract_multilingual_payload,
     is_supported_entity_id,
     iter_wikidata_entities,
+    json_loads,
     keep_tqdm_total_ahead,
     parse_language_allowlist,
     resolve_dump_path,
@@ -30,7 +37,7 @@ from .ner_typing import infer_ner_types
 CREATE_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS labels (
     id TEXT PRIMARY KEY,
-    labels_json TEXT NOT NULL
+    labels_json BLOB NOT NULL
 )
 """
 
@@ -48,6 +55,25 @@ PRAGMA_STATEMENTS = (
     "PRAGMA cache_size=-200000",
 )
 
+READ_PRAGMA_STATEMENTS = (
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-131072",
+)
+
+# labels_json rows are raw deflate primed with the keys every payload shares.
+# The dictionary is part of the on-disk format: changing it breaks existing DBs.
+_LABELS_JSON_ZDICT = (
+    b'"ner_type_source":"lexical_v1"}{"aliases":{"en":[""]},"coarse_type":"",'
+    b'"descriptions":{"en":""},"fine_type":"","labels":{"en":""},'
+)
+_LABELS_JSON_ZLIB_LEVEL = 3
+_LABELS_JSON_ZLIB_WBITS = -12
+_LABELS_JSON_ZLIB_MEMLEVEL = 4
+
+DEFAULT_WORKERS = max(1, min(8, (os.cpu_count() or 1)))
+_WORKER_CHUNK_ENTITIES = 256
+_WORKER_CHUNKS_IN_FLIGHT_FACTOR = 2
+
 
 def parse_non_negative_int(raw: str) -> int:
     try:
@@ -61,6 +87,13 @@ def parse_non_negative_int(raw: str) -> int:
     return parsed
 
 
+def parse_positive_int(raw: str) -> int:
+    parsed = parse_non_negative_int(raw)
+    if parsed == 0:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return parsed
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description=(
@@ -116,6 +149,15 @@ def parse_args() -> argparse.Namespace:
         default=8,
         help="Max aliases stored per language (default: 8, 0 disables aliases).",
     )
+    parser.add_argument(
+        "--workers",
+        type=parse_positive_int,
+        default=DEFAULT_WORKERS,
+        help=(
+            "Worker processes for label extraction and NER typing "
+            f"(default: {DEFAULT_WORKERS}, 1 keeps everything in-process)."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -127,7 +169,33 @@ def configure_db(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
-def flush_rows(conn: sqlite3.Connection, rows: list[tuple[str, str]]) -> int:
+def encode_labels_json(serialized_payload: str) -> bytes:
+    compressor = zlib.compressobj(
+        _LABELS_JSON_ZLIB_LEVEL,
+        zlib.DEFLATED,
+        _LABELS_JSON_ZLIB_WBITS,
+        _LABELS_JSON_ZLIB_MEMLEVEL,
+        zdict=_LABELS_JSON_ZDICT,
+    )
+    return compressor.compress(serialized_payload.encode("utf-8")) + compressor.flush()
+
+
+def load_labels_json(raw_payload: str | bytes) -> Any:
+    # Rows written before labels_json became a compressed blob are plain JSON text.
+    if isinstance(raw_payload, bytes):
+        decompressor = zlib.decompressobj(_LABELS_JSON_ZLIB_WBITS, zdict=_LABELS_JSON_ZDICT)
+        raw_payload = (decompressor.decompress(raw_payload) + decompressor.flush()).decode("utf-8")
+    return json_loads(raw_payload)
+
+
+def open_labels_db(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    for pragma in READ_PRAGMA_STATEMENTS:
+        conn.execute(pragma)
+    return conn
+
+
+def flush_rows(conn: sqlite3.Connection, rows: list[tuple[str, bytes]]) -> int:
     if not rows:
         return 0
 
@@ -136,6 +204,105 @@ def flush_rows(conn: sqlite3.Connection, rows: list[tuple[str, str]]) -> int:
     return len(rows)
 
 
+def _build_label_row(
+    entity: Mapping[str, Any],
+    *,
+    language_allowlist: Sequence[str],
+    max_aliases_per_language: int,
+    disable_ner_classifier: bool,
+) -> tuple[str, bytes, bool]:
+    entity_id = entity["id"]
+    payload = extract_multilingual_payload(entity)
+    payload["labels"] = select_text_map_languages(
+        payload["labels"],
+        language_allowlist,
+        fallback_to_any=True,
+    )
+    payload["descriptions"] = select_text_map_languages(
+        payload["descriptions"],
+        language_allowlist,
+        fallback_to_any=True,
+    )
+    payload["aliases"] = select_alias_map_languages(
+        payload["aliases"],
+        language_allowlist,
+        max_aliases_per_language=max_aliases_per_language,
+        fallback_to_any=False,
+    )
+    typed = False
+    if disable_ner_classifier:
+        payload["coarse_type"] = ""
+        payload["fine_type"] = ""
+        payload["ner_type_source"] = "disabled"
+    else:
+        coarse_types, fine_types, source = infer_ner_types(
+            entity_id=entity_id,
+            labels=payload["labels"],
+            aliases=payload["aliases"],
+            descriptions=payload["descriptions"],
+            claims=entity.get("claims") if isinstance(entity.get("claims"), Mapping) else None,
+        )
+        payload["coarse_type"] = coarse_types[0] if coarse_types else ""
+        payload["fine_type"] = fine_types[0] if fine_types else ""
+        payload["ner_type_source"] = source
+        typed = bool(payload["coarse_type"] or payload["fine_type"])
+
+    serialized_payload = json.dumps(
+        payload,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return entity_id, encode_labels_json(serialized_payload), typed
+
+
+def _build_label_rows(
+    entities: Sequence[Mapping[str, Any]],
+    **options: Any,
+) -> list[tuple[str, bytes, bool]]:
+    return [_build_label_row(entity, **options) for entity in entities]
+
+
+def _slim_entity_for_worker(entity: Mapping[str, Any]) -> dict[str, Any]:
+    # Only ship what label extraction and typing read; full claims dominate pickling cost.
+    claims = entity.get("claims")
+    slim: dict[str, Any] = {
+        "id": entity["id"],
+        "labels": entity.get("labels"),
+        "aliases": entity.get("aliases"),
+        "descriptions": entity.get("descriptions"),
+    }
+    if isinstance(claims, Mapping) and "P31" in claims:
+        slim["claims"] = {"P31": claims["P31"]}
+    return slim
+
+
+def _iter_label_rows_parallel(
+    entities: Iterator[Mapping[str, Any]],
+    *,
+    workers: int,
+    **options: Any,
+) -> Iterator[tuple[str, bytes, bool]]:
+    build_chunk = functools.partial(_build_label_rows, **options)
+    max_in_flight = workers * _WORKER_CHUNKS_IN_FLIGHT_FACTOR
+    in_flight: deque[Future[list[tuple[str, bytes, bool]]]] = deque()
+    chunk: list[dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for entity in entities:
+            chunk.append(_slim_entity_for_worker(entity))
+            if len(chunk) < _WORKER_CHUNK_ENTITIES:
+                continue
+            in_flight.append(executor.submit(build_chunk, chunk))
+            chunk = []
+            # Drain oldest-first so rows keep dump order and memory stays bounded.
+            while len(in_flight) >= max_in_flight:
+                yield from in_flight.popleft().result()
+        if chunk:
+            in_flight.append(executor.submit(build_chunk, chunk))
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
 def run(
     dump_path: Path,
     db_path: Path,
@@ -144,11 +311,14 @@ def run(
     disable_ner_classifier: bool,
     language_allowlist: Sequence[str] | None = None,
     max_aliases_per_language: int = 8,
+    workers: int = 1,
 ) -> int:
     if batch_size == 0:
         raise ValueError("--batch-size must be >= 1")
     if max_aliases_per_language < 0:
         raise ValueError("--max-aliases-per-language must be >= 0")
+    if workers < 1:
+        raise ValueError("--workers must be >= 1")
 
     active_language_allowlist = tuple(language_allowlist) if language_allowlist else ("en",)
 
@@ -166,7 +336,7 @@ def run(
     candidate_entities = 0
     stored_rows = 0
     typed_rows = 0
-    pending_rows: list[tuple[str, str]] = []
+    pending_rows: list[tuple[str, bytes]] = []
 
     conn = sqlite3.connect(db_path)
     try:
@@ -179,60 +349,37 @@ def run(
             print(f"Progress estimate: labels-db total~{progress_total} entities")
 
         with tqdm(total=progress_total, desc="labels-db", unit="entity") as progress:
-            for entity in iter_wikidata_entities(
-                dump_path,
-                limit=None if limit == 0 else limit,
-            ):
-                parsed_entities += 1
-                progress.update(1)
-                keep_tqdm_total_ahead(progress)
-
-                entity_id = entity.get("id")
-                if not isinstance(entity_id, str) or not is_supported_entity_id(entity_id):
-                    continue
-
-                candidate_entities += 1
-                payload = extract_multilingual_payload(entity)
-                payload["labels"] = select_text_map_languages(
-                    payload["labels"],
-                    active_language_allowlist,
-                    fallback_to_any=True,
-                )
-                payload["descriptions"] = select_text_map_languages(
-                    payload["descriptions"],
-                    active_language_allowlist,
-                    fallback_to_any=True,
-                )
-                payload["aliases"] = select_alias_map_languages(
-                    payload["aliases"],
-                    active_language_allowlist,
-                    max_aliases_per_language=max_aliases_per_language,
-                    fallback_to_any=False,
-                )
-                if disable_ner_classifier:
-                    payload["coarse_type"] = ""
-                    payload["fine_type"] = ""
-                    payload["ner_type_source"] = "disabled"
-                else:
-                    coarse_types, fine_types, source = infer_ner_types(
-                        entity_id=entity_id,
-                        labels=payload["labels"],
-                        aliases=payload["aliases"],
-                        descriptions=payload["descriptions"],
-                        claims=entity.get("claims") if isinstance(entity.get("claims"), Mapping) else None,
-                    )
-                    payload["coarse_type"] = coarse_types[0] if coarse_types else ""
-                    payload["fine_type"] = fine_types[0] if fine_types else ""
-                    payload["ner_type_source"] = source
-                    if payload["coarse_type"] or payload["fine_type"]:
-                        typed_rows += 1
-
-                serialized_payload = json.dumps(
-                    payload,
-                    ensure_ascii=False,
-                    sort_keys=True,
-                    separators=(",", ":"),
-                )
+
+            def _iter_candidate_entities() -> Iterator[Mapping[str, Any]]:
+                nonlocal parsed_entities, candidate_entities
+                for entity in iter_wikidata_entities(
+                    dump_path,
+                    limit=None if limit == 0 else limit,
+                ):
+                    parsed_entities += 1
+                    progress.update(1)
+                    keep_tqdm_total_ahead(progress)
+
+                    entity_id = entity.get("id")
+                    if not isinstance(entity_id, str) or not is_supported_entity_id(entity_id):
+                        continue
+
+                    candidate_entities += 1
+                    yield entity
+
+            row_options = {
+                "language_allowlist": active_language_allowlist,
+                "max_aliases_per_language": max_aliases_per_language,
+                "disable_ner_classifier": disable_ner_classifier,
+            }
+            label_rows = (
+                _iter_label_rows_parallel(_iter_candidate_entities(), workers=workers, **row_options)
+                if workers > 1
+                else (_build_label_row(entity, **row_options) for entity in _iter_candidate_entities())
+            )
+            for entity_id, serialized_payload, typed in label_rows:
+                if typed:
+                    typed_rows += 1
                 pending_rows.append((entity_id, serialized_payload))
 
                 if len(pending_rows) >= batch_size:
@@ -255,6 +402,7 @@ def run(
         f"typed={typed_rows}",
         f"languages={','.join(active_language_allowlist)}",
         f"max_aliases_per_language={max_aliases_per_language}",
+        f"workers={workers}",
         f"db={db_path}",
     )
     return 0
@@ -275,6 +423,7 @@ def main() -> int:
             disable_ner_classifier=args.disable_ner_classifier,
             language_allowlist=language_allowlist,
             max_aliases_per_language=args.max_aliases_per_language,
+            workers=args.workers,
         )
     except (FileNotFoundError, ValueError, sqlite3.Error) as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
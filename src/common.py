@@ -82,6 +82,41 @@ DEFAULT_STOPWORDS: set[str] = {
     "zu",
 }
 
+try:  # pragma: no cover - optional faster JSON encoding/decoding
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+_JSON_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_JSON_COMPACT_SORTED_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+_ORJSON_SORTED_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def json_dumps_bytes(value: Any, *, sort_keys: bool = False) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=_ORJSON_SORTED_OPTIONS if sort_keys else None)
+        except TypeError:
+            pass
+    encoder = _JSON_COMPACT_SORTED_ENCODER if sort_keys else _JSON_COMPACT_ENCODER
+    return encoder.encode(value).encode("utf-8")
+
+
+def json_loads(raw: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # stdlib accepts lone surrogate escapes and NaN, and reports line/column on real errors.
+            pass
+    return json.loads(raw)
+
+
+try:  # pragma: no cover - optional parallel bzip2 block decoding
+    import indexed_bzip2  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    indexed_bzip2 = None  # type: ignore
+
 try:
     from tqdm import tqdm  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover
@@ -203,6 +238,10 @@ def ensure_parent_dir(path: Path) -> None:
 def open_text_for_read(path: Path) -> TextIO:
     suffix = path.suffix.lower()
     if suffix == ".bz2":
+        if indexed_bzip2 is not None:  # pragma: no cover - optional dependency
+            # bzip2 blocks decode independently; stdlib bz2 is single-threaded and bounds full-dump passes.
+            binary_handle = indexed_bzip2.open(str(path), parallelization=os.cpu_count() or 1)
+            return io.TextIOWrapper(binary_handle, encoding="utf-8")
         return bz2.open(path, mode="rt", encoding="utf-8")
     if suffix == ".gz":
         return gzip.open(path, mode="rt", encoding="utf-8")
@@ -227,7 +266,7 @@ def iter_wikidata_entities(dump_path: Path, limit: int | None = None) -> Iterato
                 continue
 
             try:
-                parsed = json.loads(cleaned)
+                parsed = json_loads(cleaned)
             except json.JSONDecodeError as exc:
                 raise ValueError(
                     f"Could not parse JSON at line {line_number} in '{dump_path}': {exc.msg}"
@@ -591,8 +630,7 @@ def normalize_text(text: str) -> str:
 
 
 def tokenize(text: str) -> list[str]:
-    normalized = normalize_text(text).casefold()
-    return [match.group(0) for match in _TOKEN_RE.finditer(normalized)]
+    return _TOKEN_RE.findall(text.casefold())
 
 
 def build_name_text(labels: Mapping[str, str], aliases: Mapping[str, Sequence[str]]) -> str:
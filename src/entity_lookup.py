@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import hashlib
+import heapq
 import json
 import math
 import unicodedata
@@ -14,6 +16,8 @@ from .search_logic import normalize_type_labels
 
 
 DEFAULT_FUZZY_TOPK = 20
+_EXACT_TEXT_CACHE_SIZE = 65536
+_CONTEXT_TOKENS_CACHE_SIZE = 16384
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,13 +45,16 @@ def normalize_exact_text(text: str) -> str:
     return "".join(compact).strip()
 
 
+_normalize_exact_text_cached = functools.lru_cache(maxsize=_EXACT_TEXT_CACHE_SIZE)(normalize_exact_text)
+
+
 def popularity_to_prior(popularity: float) -> float:
     value = max(0.0, float(popularity))
     return 1.0 - math.exp(-math.log1p(value) / 6.0)
 
 
 def normalize_context_inputs(mention_context: str | Sequence[str] | None) -> list[str]:
-    if mention_context is None:
+    if not mention_context:
         return []
     if isinstance(mention_context, str):
         values = [mention_context]
@@ -99,13 +106,16 @@ def _normalize_score_range(values: Sequence[float]) -> list[float]:
     return [(value - min_v) / (max_v - min_v) for value in values]
 
 
+@functools.lru_cache(maxsize=_CONTEXT_TOKENS_CACHE_SIZE)
+def _context_string_tokens(context_string: str) -> frozenset[str]:
+    return frozenset(tokenize(context_string))
+
+
 def _context_score(context_string: str, context_terms: set[str]) -> float:
-    if not context_terms:
+    if not context_terms or not context_string:
         return 0.0
-    doc_terms = set(tokenize(context_string))
-    if not doc_terms:
-        return 0.0
-    overlap = len(doc_terms & context_terms)
+    # Popular candidates come back for many mentions; tokenize their context string once.
+    overlap = len(context_terms.intersection(_context_string_tokens(context_string)))
     return overlap / max(1, len(context_terms))
 
 
@@ -135,6 +145,15 @@ def _dedupe_candidates(candidates: Sequence[Mapping[str, Any]]) -> list[dict[str
     return deduped
 
 
+def _rerank_sort_key(item: Mapping[str, Any]) -> tuple[float, int, float, str]:
+    return (
+        -float(item.get("final_score", 0.0)),
+        -(1 if item.get("exact_name_match") else 0),
+        -float(item.get("prior_score", 0.0)),
+        item.get("qid") if isinstance(item.get("qid"), str) else "",
+    )
+
+
 def rerank_candidates(
     candidates: Sequence[Mapping[str, Any]],
     *,
@@ -162,7 +181,6 @@ def rerank_candidates(
     coarse_hint_set = set(coarse_hints)
     fine_hint_set = set(fine_hints)
 
-    scored: list[dict[str, Any]] = []
     for candidate, name_score in zip(deduped, normalized_name_scores, strict=False):
         context_score = _context_score(
             candidate.get("context_string", "") if isinstance(candidate.get("context_string"), str) else "",
@@ -207,9 +225,11 @@ def rerank_candidates(
             name_variants = candidate.get("name_variants")
             if isinstance(name_variants, list):
                 variant_values.extend([item for item in name_variants if isinstance(item, str)])
-        exact_name_match = mention_norm in {
-            normalize_exact_text(value) for value in [*label_values, *variant_values] if value
-        }
+        exact_name_match = any(
+            _normalize_exact_text_cached(value) == mention_norm
+            for value in (*label_values, *variant_values)
+            if value
+        )
         if exact_mode and exact_name_match:
             # For exact candidate sets, lexical equality is already satisfied; use a flat
             # name score so context/type/prior drive deterministic disambiguation.
@@ -224,37 +244,17 @@ def rerank_candidates(
         if exact_mode and exact_name_match:
             final_score += 0.05
 
-        scored.append(
-            {
-                **candidate,
-                "name_score": name_score,
-                "context_score": context_score,
-                "type_score": type_score,
-                "prior_score": prior_value,
-                "exact_name_match": exact_name_match,
-                "final_score": final_score,
-            }
-        )
-
-    scored.sort(
-        key=lambda item: (
-            float(item.get("final_score", 0.0)),
-            1 if item.get("exact_name_match") else 0,
-            float(item.get("prior_score", 0.0)),
-            item.get("qid") if isinstance(item.get("qid"), str) else "",
-        ),
-        reverse=True,
-    )
-    # Fix deterministic qid tie-break (ascending) after reverse sort.
-    scored.sort(
-        key=lambda item: (
-            -float(item.get("final_score", 0.0)),
-            -(1 if item.get("exact_name_match") else 0),
-            -float(item.get("prior_score", 0.0)),
-            item.get("qid") if isinstance(item.get("qid"), str) else "",
-        )
-    )
-    return scored[:limit]
+        # _dedupe_candidates already returned private copies, so score fields can be set in place.
+        candidate["name_score"] = name_score
+        candidate["context_score"] = context_score
+        candidate["type_score"] = type_score
+        candidate["prior_score"] = prior_value
+        candidate["exact_name_match"] = exact_name_match
+        candidate["final_score"] = final_score
+
+    # The key is a total order (qids are deduped), so a partial top-k selection gives the same
+    # result as a full sort with a deterministic ascending-qid tie-break.
+    return heapq.nsmallest(limit, deduped, key=_rerank_sort_key)
 
 
 class EntityLookupService:
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
 import argparse
-import json
+import gzip
+import http.client
+import os
 import re
 import sys
+import threading
 import time
 from collections.abc import Iterator, Mapping, Sequence
 from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
-
-from .common import resolve_configured_str, resolve_postgres_dsn, running_in_container, tqdm
+from urllib.parse import urlsplit
+
+from .common import (
+    json_dumps_bytes,
+    json_loads,
+    resolve_configured_str,
+    resolve_postgres_dsn,
+    running_in_container,
+    tqdm,
+)
 from .postgres_store import PostgresStore
 try:  # pragma: no cover - import depends on runtime environment
     import psycopg  # type: ignore
@@ -27,7 +36,7 @@ DEFAULT_INDEX_NAME = "alpaca-entities"
 DEFAULT_TABLE_NAME = "entities"
 DEFAULT_FETCH_SIZE = 10_000
 DEFAULT_BULK_ACTIONS = 2_000
-DEFAULT_WORKERS = 4
+DEFAULT_WORKERS = max(4, min(12, os.cpu_count() or 1))
 DEFAULT_MAX_RETRIES = 4
 DEFAULT_RETRY_BACKOFF_SECONDS = 1.0
 DEFAULT_REQUEST_TIMEOUT_SECONDS = 90.0
@@ -37,6 +46,13 @@ DEFAULT_WAIT_INDEX_READY_TIMEOUT_SECONDS = 180.0
 DEFAULT_MAX_INDEXED_LABELS = 12
 DEFAULT_MAX_INDEXED_ALIASES = 24
 DEFAULT_MAX_CONTEXT_CHARS = 256
+DEFAULT_AUTOTUNE_TARGET_BULK_BYTES = 10_000_000
+_AUTOTUNE_SAMPLE_DOCS = 1_000
+_AUTOTUNE_MIN_BULK_ACTIONS = 100
+_AUTOTUNE_MAX_BULK_ACTIONS = 20_000
+_BULK_GZIP_LEVEL = 1
+_BULK_REJECTED_STATUSES = frozenset({413, 429})
+_HTTP_CONNECTIONS = threading.local()
 
 _IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
@@ -45,6 +61,12 @@ class ElasticsearchIndexingError(RuntimeError):
     pass
 
 
+class ElasticsearchBulkRejectedError(ElasticsearchIndexingError):
+    def __init__(self, message: str, *, status: int) -> None:
+        super().__init__(message)
+        self.status = int(status)
+
+
 def default_elasticsearch_url() -> str:
     if running_in_container():
         return DEFAULT_ELASTICSEARCH_URL_DOCKER
@@ -155,6 +177,29 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_BULK_ACTIONS,
         help=f"Documents per Elasticsearch _bulk request (default: {DEFAULT_BULK_ACTIONS}).",
     )
+    parser.add_argument(
+        "--autotune-bulk-actions",
+        action="store_true",
+        help=(
+            "Derive documents per _bulk request from the p95 serialized size of the first "
+            "fetched documents, targeting --bulk-target-bytes per request."
+        ),
+    )
+    parser.add_argument(
+        "--bulk-target-bytes",
+        type=parse_positive_int,
+        default=DEFAULT_AUTOTUNE_TARGET_BULK_BYTES,
+        help=(
+            "Maximum uncompressed _bulk body size; requests are flushed early once reached. "
+            "Also the target used by --autotune-bulk-actions "
+            f"(default: {DEFAULT_AUTOTUNE_TARGET_BULK_BYTES})."
+        ),
+    )
+    parser.add_argument(
+        "--bulk-gzip",
+        action="store_true",
+        help="Gzip-compress _bulk request bodies (useful when Elasticsearch is on a remote host).",
+    )
     parser.add_argument(
         "--workers",
         type=parse_positive_int,
@@ -274,6 +319,55 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _es_connection(base_url: str, timeout_seconds: float) -> tuple[http.client.HTTPConnection, str]:
+    parts = urlsplit(base_url)
+    key = (parts.scheme, parts.netloc, float(timeout_seconds))
+    connections = getattr(_HTTP_CONNECTIONS, "by_origin", None)
+    if connections is None:
+        connections = {}
+        _HTTP_CONNECTIONS.by_origin = connections
+    connection = connections.get(key)
+    if connection is None:
+        connection_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        connection = connection_cls(parts.netloc, timeout=timeout_seconds)
+        connections[key] = connection
+    return connection, parts.path.rstrip("/")
+
+
+def _drop_es_connection(base_url: str, timeout_seconds: float) -> None:
+    parts = urlsplit(base_url)
+    connections = getattr(_HTTP_CONNECTIONS, "by_origin", None)
+    if not connections:
+        return
+    connection = connections.pop((parts.scheme, parts.netloc, float(timeout_seconds)), None)
+    if connection is not None:
+        connection.close()
+
+
+def _es_http_request(
+    *,
+    base_url: str,
+    method: str,
+    path: str,
+    payload: bytes | None,
+    headers: Mapping[str, str],
+    timeout_seconds: float,
+) -> tuple[int, bytes]:
+    for attempt in range(2):
+        connection, path_prefix = _es_connection(base_url, timeout_seconds)
+        try:
+            connection.request(method, f"{path_prefix}{path}", body=payload, headers=dict(headers))
+            response = connection.getresponse()
+            return int(response.status), response.read()
+        except (http.client.HTTPException, OSError) as exc:
+            # Keep-alive sockets can be closed by the server between requests; retry once on a fresh one.
+            _drop_es_connection(base_url, timeout_seconds)
+            if attempt == 0 and isinstance(exc, (http.client.RemoteDisconnected, ConnectionError)):
+                continue
+            raise ElasticsearchIndexingError(f"Elasticsearch {method} {path} failed: {exc}") from exc
+    raise ElasticsearchIndexingError(f"Elasticsearch {method} {path} failed.")  # pragma: no cover
+
+
 def _es_request_json(
     *,
     base_url: str,
@@ -286,22 +380,21 @@ def _es_request_json(
     payload = None
     headers: dict[str, str] = {}
     if body is not None:
-        payload = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        payload = json_dumps_bytes(body)
         headers["Content-Type"] = "application/json"
-    request = Request(f"{base_url}{path}", data=payload, headers=headers, method=method)
-    try:
-        with urlopen(request, timeout=timeout_seconds) as response:
-            status = int(response.getcode())
-            response_body = response.read()
-    except HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace")
-        raise ElasticsearchIndexingError(
-            f"Elasticsearch {method} {path} failed with status {exc.code}: {detail[:1500]}"
-        ) from exc
-    except URLError as exc:
+    status, response_body = _es_http_request(
+        base_url=base_url,
+        method=method,
+        path=path,
+        payload=payload,
+        headers=headers,
+        timeout_seconds=timeout_seconds,
+    )
+    if status >= 400:
+        detail = response_body.decode("utf-8", errors="replace")
         raise ElasticsearchIndexingError(
-            f"Elasticsearch {method} {path} failed: {exc.reason}"
-        ) from exc
+            f"Elasticsearch {method} {path} failed with status {status}: {detail[:1500]}"
+        )
 
     if status not in expected_statuses:
         text = response_body.decode("utf-8", errors="replace")
@@ -311,28 +404,29 @@ def _es_request_json(
     if not response_body:
         return {}
     try:
-        parsed = json.loads(response_body.decode("utf-8"))
-    except json.JSONDecodeError:
+        parsed = json_loads(response_body)
+    except ValueError:
         return {}
     return parsed if isinstance(parsed, dict) else {}
 
 
 def _es_index_exists(*, base_url: str, index_name: str, timeout_seconds: float) -> bool:
-    request = Request(f"{base_url}/{index_name}", method="HEAD")
-    try:
-        with urlopen(request, timeout=timeout_seconds):
-            return True
-    except HTTPError as exc:
-        if exc.code == 404:
-            return False
-        detail = exc.read().decode("utf-8", errors="replace")
-        raise ElasticsearchIndexingError(
-            f"Could not check index '{index_name}' (status {exc.code}): {detail[:1000]}"
-        ) from exc
-    except URLError as exc:
+    status, response_body = _es_http_request(
+        base_url=base_url,
+        method="HEAD",
+        path=f"/{index_name}",
+        payload=None,
+        headers={},
+        timeout_seconds=timeout_seconds,
+    )
+    if status == 404:
+        return False
+    if status >= 400:
+        detail = response_body.decode("utf-8", errors="replace")
         raise ElasticsearchIndexingError(
-            f"Could not check index '{index_name}': {exc.reason}"
-        ) from exc
+            f"Could not check index '{index_name}' (status {status}): {detail[:1000]}"
+        )
+    return True
 
 
 def _build_index_payload() -> dict[str, Any]:
@@ -761,22 +855,62 @@ def _count_source_rows(
     return int(count) if isinstance(count, int) else 0
 
 
-def _chunked(values: Sequence[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
-    if size <= 0:
-        raise ValueError("chunk size must be > 0")
-    for start in range(0, len(values), size):
-        yield list(values[start : start + size])
+def _autotune_bulk_actions(docs: Sequence[dict[str, Any]], *, target_bytes: int) -> int | None:
+    sample = docs[:_AUTOTUNE_SAMPLE_DOCS]
+    if not sample:
+        return None
+    sizes = sorted(len(json_dumps_bytes(doc)) for doc in sample)
+    p95_bytes = sizes[min(len(sizes) - 1, (len(sizes) * 95) // 100)]
+    # Each document also carries its action line and two newlines.
+    per_doc_bytes = max(1, p95_bytes + 64)
+    return max(_AUTOTUNE_MIN_BULK_ACTIONS, min(_AUTOTUNE_MAX_BULK_ACTIONS, int(target_bytes) // per_doc_bytes))
 
 
-def _bulk_payload(index_name: str, docs: Sequence[dict[str, Any]]) -> bytes:
-    lines: list[str] = []
+def _iter_bulk_payloads(
+    index_name: str,
+    docs: Sequence[dict[str, Any]],
+    *,
+    max_actions: int,
+    max_bytes: int,
+) -> Iterator[tuple[bytes, int]]:
+    if max_actions <= 0 or max_bytes <= 0:
+        raise ValueError("bulk limits must be > 0")
+    lines: list[bytes] = []
+    pending_bytes = 0
     for doc in docs:
         qid = doc.get("qid")
         if not isinstance(qid, str) or not qid:
             continue
-        lines.append(json.dumps({"index": {"_index": index_name, "_id": qid}}, separators=(",", ":")))
-        lines.append(json.dumps(doc, ensure_ascii=False, separators=(",", ":")))
-    return ("\n".join(lines) + "\n").encode("utf-8")
+        action = json_dumps_bytes({"index": {"_index": index_name, "_id": qid}})
+        source = json_dumps_bytes(doc)
+        doc_bytes = len(action) + len(source) + 2
+        # Flush on whichever limit is hit first so large documents cannot push a
+        # request past the cluster's http.max_content_length.
+        if lines and pending_bytes + doc_bytes > max_bytes:
+            yield b"\n".join(lines) + b"\n", len(lines) // 2
+            lines = []
+            pending_bytes = 0
+        lines.append(action)
+        lines.append(source)
+        pending_bytes += doc_bytes
+        if len(lines) // 2 >= max_actions:
+            yield b"\n".join(lines) + b"\n", len(lines) // 2
+            lines = []
+            pending_bytes = 0
+    if lines:
+        yield b"\n".join(lines) + b"\n", len(lines) // 2
+
+
+def _split_bulk_payload(payload: bytes) -> tuple[tuple[bytes, int], tuple[bytes, int]] | None:
+    lines = payload.rstrip(b"\n").split(b"\n")
+    doc_count = len(lines) // 2
+    if doc_count < 2:
+        return None
+    middle = (doc_count // 2) * 2
+    return (
+        (b"\n".join(lines[:middle]) + b"\n", middle // 2),
+        (b"\n".join(lines[middle:]) + b"\n", doc_count - middle // 2),
+    )
 
 
 def _post_bulk(
@@ -784,26 +918,25 @@ def _post_bulk(
     base_url: str,
     payload: bytes,
     timeout_seconds: float,
+    gzipped: bool = False,
 ) -> dict[str, Any]:
-    request = Request(
-        f"{base_url}/_bulk?refresh=false",
-        data=payload,
-        headers={"Content-Type": "application/x-ndjson"},
+    headers = {"Content-Type": "application/x-ndjson"}
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+    status, raw = _es_http_request(
+        base_url=base_url,
         method="POST",
+        path="/_bulk?refresh=false",
+        payload=payload,
+        headers=headers,
+        timeout_seconds=timeout_seconds,
     )
-    try:
-        with urlopen(request, timeout=timeout_seconds) as response:
-            status = int(response.getcode())
-            raw = response.read()
-    except HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace")
-        raise ElasticsearchIndexingError(
-            f"Elasticsearch _bulk request failed with status {exc.code}: {detail[:2000]}"
-        ) from exc
-    except URLError as exc:
-        raise ElasticsearchIndexingError(
-            f"Elasticsearch _bulk request failed: {exc.reason}"
-        ) from exc
+    if status >= 400:
+        detail = raw.decode("utf-8", errors="replace")
+        message = f"Elasticsearch _bulk request failed with status {status}: {detail[:2000]}"
+        if status in _BULK_REJECTED_STATUSES:
+            raise ElasticsearchBulkRejectedError(message, status=status)
+        raise ElasticsearchIndexingError(message)
 
     if status != 200:
         detail = raw.decode("utf-8", errors="replace")
@@ -811,8 +944,8 @@ def _post_bulk(
             f"Elasticsearch _bulk request returned status {status}: {detail[:2000]}"
         )
     try:
-        parsed = json.loads(raw.decode("utf-8"))
-    except json.JSONDecodeError as exc:
+        parsed = json_loads(raw)
+    except ValueError as exc:
         raise ElasticsearchIndexingError(f"Could not parse _bulk response JSON: {exc}") from exc
     if not isinstance(parsed, dict):
         raise ElasticsearchIndexingError("Elasticsearch _bulk response was not a JSON object.")
@@ -860,24 +993,48 @@ def _index_bulk_with_retries(
     timeout_seconds: float,
     max_retries: int,
     retry_backoff_seconds: float,
+    gzip_payload: bool = False,
 ) -> int:
+    body = gzip.compress(payload, compresslevel=_BULK_GZIP_LEVEL) if gzip_payload else payload
     attempt = 0
     while True:
-        response = _post_bulk(
-            base_url=base_url,
-            payload=payload,
-            timeout_seconds=timeout_seconds,
-        )
-        if not bool(response.get("errors")):
-            return int(doc_count)
-
-        failed_count, retryable, sample = _summarize_bulk_failures(response)
-        message = (
-            f"Bulk request had {failed_count} failed docs out of {doc_count}. "
-            f"Sample errors: {sample or 'n/a'}"
-        )
-        if not retryable or attempt >= max_retries:
-            raise ElasticsearchIndexingError(message)
+        try:
+            response = _post_bulk(
+                base_url=base_url,
+                payload=body,
+                timeout_seconds=timeout_seconds,
+                gzipped=gzip_payload,
+            )
+        except ElasticsearchBulkRejectedError as exc:
+            halves = _split_bulk_payload(payload) if exc.status == 413 else None
+            if halves is not None:
+                print(f"WARN: _bulk request with {doc_count} docs was too large; splitting in half.")
+                return sum(
+                    _index_bulk_with_retries(
+                        base_url=base_url,
+                        payload=half_payload,
+                        doc_count=half_count,
+                        timeout_seconds=timeout_seconds,
+                        max_retries=max_retries,
+                        retry_backoff_seconds=retry_backoff_seconds,
+                        gzip_payload=gzip_payload,
+                    )
+                    for half_payload, half_count in halves
+                )
+            if exc.status != 429 or attempt >= max_retries:
+                raise
+            message = str(exc)
+        else:
+            if not bool(response.get("errors")):
+                return int(doc_count)
+
+            failed_count, retryable, sample = _summarize_bulk_failures(response)
+            message = (
+                f"Bulk request had {failed_count} failed docs out of {doc_count}. "
+                f"Sample errors: {sample or 'n/a'}"
+            )
+            if not retryable or attempt >= max_retries:
+                raise ElasticsearchIndexingError(message)
         sleep_seconds = retry_backoff_seconds * (2**attempt)
         print(
             f"WARN: {message} Retrying in {sleep_seconds:.1f}s "
@@ -944,6 +1101,8 @@ def _run(args: argparse.Namespace) -> int:
         print(f"Source rows to index: {total_rows}")
 
     max_inflight = int(args.max_inflight) if int(args.max_inflight) > 0 else int(args.workers) * 3
+    bulk_actions = int(args.bulk_actions)
+    autotune_pending = bool(args.autotune_bulk_actions)
     docs_read = 0
     docs_indexed = 0
     bulk_submitted = 0
@@ -954,7 +1113,8 @@ def _run(args: argparse.Namespace) -> int:
         f"table={table_name}",
         f"index={index_name}",
         f"batch_size={args.batch_size}",
-        f"bulk_actions={args.bulk_actions}",
+        f"bulk_actions={'auto' if args.autotune_bulk_actions else args.bulk_actions}",
+        f"bulk_gzip={bool(args.bulk_gzip)}",
         f"workers={args.workers}",
         f"max_inflight={max_inflight}",
         f"updated_since={args.updated_since or 'n/a'}",
@@ -974,78 +1134,101 @@ def _run(args: argparse.Namespace) -> int:
         request_timeout_seconds=float(args.request_timeout_seconds),
     )
 
-    with ThreadPoolExecutor(max_workers=int(args.workers)) as pool:
-        with tqdm(total=total_rows, desc="pg->es", unit="doc") as progress:
-            for batch_docs in _iter_documents_from_postgres(
-                postgres_dsn=postgres_dsn,
-                table_name=table_name,
-                batch_size=int(args.batch_size),
-                updated_since=args.updated_since,
-                max_indexed_labels=int(args.max_indexed_labels),
-                max_indexed_aliases=int(args.max_indexed_aliases),
-                max_context_chars=int(args.max_context_chars),
-            ):
-                docs_read += len(batch_docs)
+    indexing_completed = False
+    try:
+        with ThreadPoolExecutor(max_workers=int(args.workers)) as pool:
+            with tqdm(total=total_rows, desc="pg->es", unit="doc") as progress:
+                for batch_docs in _iter_documents_from_postgres(
+                    postgres_dsn=postgres_dsn,
+                    table_name=table_name,
+                    batch_size=int(args.batch_size),
+                    updated_since=args.updated_since,
+                    max_indexed_labels=int(args.max_indexed_labels),
+                    max_indexed_aliases=int(args.max_indexed_aliases),
+                    max_context_chars=int(args.max_context_chars),
+                ):
+                    docs_read += len(batch_docs)
+                    if autotune_pending:
+                        autotune_pending = False
+                        tuned = _autotune_bulk_actions(batch_docs, target_bytes=int(args.bulk_target_bytes))
+                        if tuned is not None:
+                            bulk_actions = tuned
+                            print(
+                                "Autotuned bulk request size:",
+                                f"bulk_actions={bulk_actions}",
+                                f"target_bytes={args.bulk_target_bytes}",
+                            )
+                    progress.set_postfix(
+                        read=docs_read,
+                        indexed=docs_indexed,
+                        inflight=len(futures),
+                        submitted=bulk_submitted,
+                    )
+
+                    for payload, doc_count in _iter_bulk_payloads(
+                        index_name,
+                        batch_docs,
+                        max_actions=bulk_actions,
+                        max_bytes=int(args.bulk_target_bytes),
+                    ):
+                        future = pool.submit(
+                            _index_bulk_with_retries,
+                            base_url=elasticsearch_url,
+                            payload=payload,
+                            doc_count=doc_count,
+                            timeout_seconds=float(args.request_timeout_seconds),
+                            max_retries=int(args.max_retries),
+                            retry_backoff_seconds=float(args.retry_backoff_seconds),
+                            gzip_payload=bool(args.bulk_gzip),
+                        )
+                        futures.add(future)
+                        bulk_submitted += 1
+
+                        if len(futures) >= max_inflight:
+                            indexed, futures = _drain_futures(
+                                futures,
+                                return_when=FIRST_COMPLETED,
+                            )
+                            docs_indexed += indexed
+                            progress.update(indexed)
+                            progress.set_postfix(
+                                read=docs_read,
+                                indexed=docs_indexed,
+                                inflight=len(futures),
+                                submitted=bulk_submitted,
+                            )
+
+                indexed, futures = _drain_futures(futures, return_when=ALL_COMPLETED)
+                docs_indexed += indexed
+                progress.update(indexed)
                 progress.set_postfix(
                     read=docs_read,
                     indexed=docs_indexed,
                     inflight=len(futures),
                     submitted=bulk_submitted,
                 )
-
-                for chunk in _chunked(batch_docs, int(args.bulk_actions)):
-                    payload = _bulk_payload(index_name, chunk)
-                    if not payload.strip():
-                        continue
-                    future = pool.submit(
-                        _index_bulk_with_retries,
-                        base_url=elasticsearch_url,
-                        payload=payload,
-                        doc_count=len(chunk),
-                        timeout_seconds=float(args.request_timeout_seconds),
-                        max_retries=int(args.max_retries),
-                        retry_backoff_seconds=float(args.retry_backoff_seconds),
-                    )
-                    futures.add(future)
-                    bulk_submitted += 1
-
-                    if len(futures) >= max_inflight:
-                        indexed, futures = _drain_futures(
-                            futures,
-                            return_when=FIRST_COMPLETED,
-                        )
-                        docs_indexed += indexed
-                        progress.update(indexed)
-                        progress.set_postfix(
-                            read=docs_read,
-                            indexed=docs_indexed,
-                            inflight=len(futures),
-                            submitted=bulk_submitted,
-                        )
-
-            indexed, futures = _drain_futures(futures, return_when=ALL_COMPLETED)
-            docs_indexed += indexed
-            progress.update(indexed)
-            progress.set_postfix(
-                read=docs_read,
-                indexed=docs_indexed,
-                inflight=len(futures),
-                submitted=bulk_submitted,
+        indexing_completed = True
+    finally:
+        # Always restore refresh/replica settings so a failed run does not leave the index
+        # unsearchable with refresh disabled.
+        if not args.skip_finalize_settings:
+            print(
+                "Restoring index runtime settings:",
+                f"refresh_interval={args.final_refresh_interval}",
+                f"number_of_replicas={args.final_replicas}",
             )
-
-    if not args.skip_finalize_settings:
-        print(
-            "Restoring index runtime settings:",
-            f"refresh_interval={args.final_refresh_interval}",
-            f"number_of_replicas={args.final_replicas}",
-        )
-        _finalize_index(
-            base_url=elasticsearch_url,
-            index_name=index_name,
-            final_refresh_interval=str(args.final_refresh_interval),
-            final_replicas=int(args.final_replicas),
-            timeout_seconds=float(args.request_timeout_seconds),
-        )
+            try:
+                _finalize_index(
+                    base_url=elasticsearch_url,
+                    index_name=index_name,
+                    final_refresh_interval=str(args.final_refresh_interval),
+                    final_replicas=int(args.final_replicas),
+                    timeout_seconds=float(args.request_timeout_seconds),
+                )
+            except ElasticsearchIndexingError as exc:
+                if indexing_completed:
+                    raise
+                print(f"WARN: could not restore index settings after failure: {exc}", file=sys.stderr)
 
     print(
         "Done:",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
@@ -328,6 +329,35 @@ FINE_TYPE_RULES: tuple[FineTypeRule, ...] = (
 )
 
 HUMAN_INSTANCE_OF_QIDS = frozenset({"Q5"})
+_TEXT_CLUES_CACHE_SIZE = 131_072
+
+
+def _build_rules_by_token_clue(rules: Sequence[FineTypeRule]) -> dict[str, tuple[int, ...]]:
+    index: dict[str, list[int]] = {}
+    for rule_index, rule in enumerate(rules):
+        for token in rule.token_clues:
+            index.setdefault(token, []).append(rule_index)
+    return {token: tuple(rule_indexes) for token, rule_indexes in index.items()}
+
+
+# Inverted token-clue index: score only the rules hit by the entity's own tokens
+# instead of probing every clue of every rule.
+_RULES_BY_TOKEN_CLUE = _build_rules_by_token_clue(FINE_TYPE_RULES)
+
+
+# Boilerplate descriptions ("human", "Wikimedia disambiguation page", ...) repeat across
+# millions of entities, so clue matching is memoized per text value rather than per entity.
+@functools.lru_cache(maxsize=_TEXT_CLUES_CACHE_SIZE)
+def _text_value_clues(value: str) -> tuple[frozenset[str], frozenset[tuple[int, str]]]:
+    folded = value.casefold()
+    tokens = frozenset(token for token in tokenize(folded) if token in _RULES_BY_TOKEN_CLUE)
+    phrases = frozenset(
+        (rule_index, phrase)
+        for rule_index, rule in enumerate(FINE_TYPE_RULES)
+        for phrase in rule.phrase_clues
+        if phrase and phrase in folded
+    )
+    return tokens, phrases
 
 
 def _extract_claim_entity_ids(
@@ -459,15 +489,22 @@ def infer_ner_types(
     if not text_values:
         return ["MISC"], ["MISC"], "lexical_v1"
 
-    normalized_text = "\n".join(value.casefold() for value in text_values)
-    token_set = set(tokenize(normalized_text))
+    token_set: set[str] = set()
+    phrase_hits: set[tuple[int, str]] = set()
+    for value in text_values:
+        value_tokens, value_phrases = _text_value_clues(value)
+        token_set.update(value_tokens)
+        phrase_hits.update(value_phrases)
 
-    scored_rules: list[tuple[int, FineTypeRule]] = []
-    for rule in FINE_TYPE_RULES:
-        score = 0
-        score += sum(1 for token in rule.token_clues if token in token_set)
-        score += sum(2 for phrase in rule.phrase_clues if phrase and phrase in normalized_text)
+    rule_scores = [0] * len(FINE_TYPE_RULES)
+    for token in token_set:
+        for rule_index in _RULES_BY_TOKEN_CLUE[token]:
+            rule_scores[rule_index] += 1
+    for rule_index, _phrase in phrase_hits:
+        rule_scores[rule_index] += 2
 
+    scored_rules: list[tuple[int, FineTypeRule]] = []
+    for rule, score in zip(FINE_TYPE_RULES, rule_scores):
         if score >= rule.min_score:
             scored_rules.append((score, rule))
 
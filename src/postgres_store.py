@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import contextlib
+import functools
 import json
 import math
 import re
+import threading
+import time
 import zlib
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
-from urllib.parse import urlsplit
 
-from .common import normalize_text
+from .common import json_dumps_bytes, json_loads, normalize_text
 
 
 try:  # pragma: no cover - exercised in integration environments
@@ -17,6 +21,16 @@ try:  # pragma: no cover - exercised in integration environments
 except ModuleNotFoundError:  # pragma: no cover
     psycopg = None  # type: ignore
 
+try:  # pragma: no cover - exercised in integration environments
+    from psycopg_pool import ConnectionPool  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    ConnectionPool = None  # type: ignore
+
+if psycopg is not None:  # pragma: no cover - exercised in integration environments
+    from psycopg.types.json import set_json_loads
+
+    set_json_loads(json_loads)
+
 
 class PostgresStoreError(RuntimeError):
     pass
@@ -50,6 +64,12 @@ _DBPEDIA_PREFIX = "https://dbpedia.org/resource/"
 _WIKIPEDIA_DEFAULT_HOST = "en.wikipedia.org"
 _DBPEDIA_DEFAULT_HOST = "dbpedia.org"
 _HOSTED_REF_SEPARATOR = "|"
+_HTTP_SCHEMES = ("http://", "https://")
+_CROSSREF_CACHE_SIZE = 8192
+_LANGUAGE_ORDER_CACHE_SIZE = 1024
+_NORMALIZE_TERM_CACHE_SIZE = 131_072
+_URL_NETLOC_DELIMITERS = ("/", "?", "#")
+_URL_PATH_DELIMITERS = ("?", "#")
 _PRIMARY_LABEL_LANGUAGE_PREFERENCE = ("en", "mul")
 _EMPTY_ENTITY_NAME_PAYLOAD = '{"aliases":[],"labels":[]}'
 _EMPTY_ENTITY_NAME_PAYLOAD_BYTES = zlib.compress(_EMPTY_ENTITY_NAME_PAYLOAD.encode("utf-8"), level=9)
@@ -59,10 +79,57 @@ MAX_STORED_ALIASES = 128
 DEFAULT_INDEX_PROFILE = "lean"
 VALID_INDEX_PROFILES = frozenset({"lean", "full"})
 DEFAULT_MAX_CONTEXT_CHARS = 512
+SAMPLE_PAYLOAD_FULL = "full"
+SAMPLE_PAYLOAD_LABELS_ONLY = "labels_only"
 _SIM_SAMPLE_MULTIPLIER = 1_103_515_245
 _SIM_SAMPLE_SEED_MULTIPLIER = 97_531
 _SIM_SAMPLE_INCREMENT = 12_345
 _SIM_SAMPLE_MODULUS = 2_147_483_647
+_POOL_MIN_SIZE = 1
+_POOL_MAX_SIZE = 8
+_POOL_OPEN_TIMEOUT_SECONDS = 10.0
+_CONNECTION_POOLS: dict[str, Any] = {}
+_CONNECTION_POOLS_LOCK = threading.Lock()
+_QUERY_CACHE_LRU_SIZE = 8192
+# Entries expire so a TRUNCATE or rebuild done by another process is picked up without a restart.
+_QUERY_CACHE_LRU_TTL_SECONDS = 60.0
+# Entries are stored serialized so every hit decodes a private copy of the nested candidate lists.
+_QUERY_CACHE_LRU: OrderedDict[tuple[str, str], tuple[float, bytes]] = OrderedDict()
+_QUERY_CACHE_LRU_LOCK = threading.Lock()
+_ENTITY_UPSERT_STAGE_TABLE = "alpaca_entities_stage"
+_MULTI_ROW_INSERT_CHUNK_SIZE = 1000
+_COPY_MIN_ROWS = 1024
+_ENTITY_NAME_STAGE_TABLE = "alpaca_entity_names_stage"
+_ENTITY_UPSERT_COLUMNS = (
+    "qid",
+    "label",
+    "labels",
+    "aliases",
+    "description",
+    "types",
+    "coarse_type",
+    "fine_type",
+    "item_category",
+    "popularity",
+    "prior",
+    "wikipedia_url",
+    "dbpedia_url",
+)
+_ENTITY_UPSERT_COPY_TYPES = (
+    "text",
+    "text",
+    "text[]",
+    "text[]",
+    "text",
+    "text[]",
+    "text",
+    "text",
+    "text",
+    "float8",
+    "float8",
+    "text",
+    "text",
+)
 _LEGACY_ENTITY_TRIPLES_INDEX_NAMES = (
     "idx_entity_triples_subject_qid",
     "idx_entity_triples_object_qid",
@@ -85,9 +152,17 @@ def entity_context_inputs_table_name(base_table_name: str) -> str:
     return f"{stripped}_context_inputs"
 
 
+_normalize_term = functools.lru_cache(maxsize=_NORMALIZE_TERM_CACHE_SIZE)(normalize_text)
+
+
 def _quote_identifier(name: str) -> str:
     if not isinstance(name, str):
         raise ValueError("SQL identifier must be a string.")
+    return _quote_identifier_cached(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _quote_identifier_cached(name: str) -> str:
     stripped = name.strip()
     if not _SQL_IDENTIFIER_RE.match(stripped):
         raise ValueError(
@@ -96,6 +171,20 @@ def _quote_identifier(name: str) -> str:
     return f'"{stripped}"'
 
 
+def _multi_row_values_sql(row_template: str, row_count: int) -> str:
+    return ", ".join([row_template] * row_count)
+
+
+def _iter_value_chunks(
+    payload: Sequence[tuple[Any, ...]],
+    *,
+    chunk_size: int = _MULTI_ROW_INSERT_CHUNK_SIZE,
+) -> Iterator[tuple[int, list[Any]]]:
+    for start in range(0, len(payload), chunk_size):
+        chunk = payload[start : start + chunk_size]
+        yield len(chunk), [value for values in chunk for value in values]
+
+
 def _entity_triples_index_drop_statements() -> list[str]:
     return [
         f"DROP INDEX IF EXISTS {_quote_identifier(index_name)};"
@@ -130,21 +219,106 @@ def sampled_seed_row_number(*, sample_no: int, seed_count: int, random_seed: int
 
 
 def _json_compact(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
-
-
+    return json_dumps_bytes(value, sort_keys=True).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def _fuzzy_candidates_sql(has_crosslinks: bool, has_coarse: bool, has_fine: bool) -> str:
+    # One stable SQL text per hint combination so psycopg can reuse prepared plans.
+    base_match_sql = (
+        "("
+        "LOWER(label) = q.mention_lower OR "
+        "label ILIKE q.mention_like OR "
+        "EXISTS (SELECT 1 FROM unnest(labels) AS v WHERE LOWER(v) = q.mention_lower) OR "
+        "EXISTS (SELECT 1 FROM unnest(labels) AS v WHERE v ILIKE q.mention_like) OR "
+        "EXISTS (SELECT 1 FROM unnest(aliases) AS v WHERE LOWER(v) = q.mention_lower) OR "
+        "EXISTS (SELECT 1 FROM unnest(aliases) AS v WHERE v ILIKE q.mention_like)"
+    )
+    if has_crosslinks:
+        base_match_sql += " OR wikipedia_url = ANY(q.crosslinks) OR dbpedia_url = ANY(q.crosslinks)"
+    base_match_sql += ")"
+    where_parts = [base_match_sql]
+    if has_coarse:
+        where_parts.append("coarse_type = ANY(%s)")
+    if has_fine:
+        where_parts.append("fine_type = ANY(%s)")
+
+    return f"""
+    SELECT jsonb_build_object(
+        'qid', c.qid,
+        'label', c.label,
+        'labels', to_jsonb(c.labels),
+        'aliases', to_jsonb(c.aliases),
+        'description', c.description,
+        'types', to_jsonb(c.types),
+        'coarse_type', c.coarse_type,
+        'fine_type', c.fine_type,
+        'item_category', c.item_category,
+        'popularity', c.popularity,
+        'prior', c.prior,
+        'wikipedia_url', c.wikipedia_url,
+        'dbpedia_url', c.dbpedia_url,
+        'score', c.score
+    )
+    FROM (
+    SELECT
+        qid, label, labels, aliases, description, types,
+        coarse_type, fine_type, item_category, popularity, prior, wikipedia_url, dbpedia_url,
+        (
+            CASE WHEN LOWER(label) = q.mention_lower THEN 4.0 ELSE 0.0 END +
+            CASE WHEN EXISTS (SELECT 1 FROM unnest(labels) AS v WHERE LOWER(v) = q.mention_lower) THEN 3.0 ELSE 0.0 END +
+            CASE WHEN EXISTS (SELECT 1 FROM unnest(aliases) AS v WHERE LOWER(v) = q.mention_lower) THEN 2.5 ELSE 0.0 END +
+            CASE WHEN label ILIKE q.mention_like THEN 1.5 ELSE 0.0 END +
+            CASE WHEN EXISTS (SELECT 1 FROM unnest(labels) AS v WHERE v ILIKE q.mention_like) THEN 1.25 ELSE 0.0 END +
+            CASE WHEN EXISTS (SELECT 1 FROM unnest(aliases) AS v WHERE v ILIKE q.mention_like) THEN 1.0 ELSE 0.0 END +
+            CASE
+                WHEN wikipedia_url = ANY(q.crosslinks) OR dbpedia_url = ANY(q.crosslinks) THEN 1.5
+                ELSE 0.0
+            END
+        ) AS score
+    FROM entities
+    CROSS JOIN (
+        SELECT LOWER(%s) AS mention_lower, %s::text AS mention_like, %s::text[] AS crosslinks
+    ) AS q
+    WHERE {' AND '.join(where_parts)}
+    ORDER BY score DESC, prior DESC, qid ASC
+    LIMIT %s
+    ) AS c
+    ORDER BY c.score DESC, c.prior DESC, c.qid ASC
+    """
+
+
+def _split_url_netloc_path(raw: str) -> tuple[str, str]:
+    _, _, rest = raw.partition("://")
+    netloc_end = len(rest)
+    for delimiter in _URL_NETLOC_DELIMITERS:
+        index = rest.find(delimiter, 0, netloc_end)
+        if index != -1:
+            netloc_end = index
+    netloc = rest[:netloc_end]
+    path = rest[netloc_end:]
+    if not path.startswith("/"):
+        return netloc, ""
+    for delimiter in _URL_PATH_DELIMITERS:
+        index = path.find(delimiter)
+        if index != -1:
+            path = path[:index]
+    return netloc, path
+
+
+@functools.lru_cache(maxsize=_CROSSREF_CACHE_SIZE)
 def _compact_wikipedia_ref(value: str) -> str:
     raw = value.strip()
     if not raw:
         return ""
     if raw.startswith(_WIKIPEDIA_PREFIX):
         return raw[len(_WIKIPEDIA_PREFIX):]
-    if raw.startswith("http://") or raw.startswith("https://"):
-        parsed = urlsplit(raw)
+    if raw.startswith(_HTTP_SCHEMES):
+        netloc, path = _split_url_netloc_path(raw)
         marker = "/wiki/"
-        if parsed.netloc and parsed.path and marker in parsed.path:
-            title = parsed.path.split(marker, 1)[1]
-            host = parsed.netloc.strip().lower()
+        if netloc and path and marker in path:
+            title = path.split(marker, 1)[1]
+            host = netloc.strip().lower()
             if not host:
                 return title
             if host == _WIKIPEDIA_DEFAULT_HOST:
@@ -153,18 +327,19 @@ def _compact_wikipedia_ref(value: str) -> str:
     return raw
 
 
+@functools.lru_cache(maxsize=_CROSSREF_CACHE_SIZE)
 def _compact_dbpedia_ref(value: str) -> str:
     raw = value.strip()
     if not raw:
         return ""
     if raw.startswith(_DBPEDIA_PREFIX):
         return raw[len(_DBPEDIA_PREFIX):]
-    if raw.startswith("http://") or raw.startswith("https://"):
-        parsed = urlsplit(raw)
+    if raw.startswith(_HTTP_SCHEMES):
+        netloc, path = _split_url_netloc_path(raw)
         marker = "/resource/"
-        if parsed.netloc and parsed.path and marker in parsed.path:
-            title = parsed.path.split(marker, 1)[1]
-            host = parsed.netloc.strip().lower()
+        if netloc and path and marker in path:
+            title = path.split(marker, 1)[1]
+            host = netloc.strip().lower()
             if not host:
                 return title
             if host == _DBPEDIA_DEFAULT_HOST:
@@ -186,11 +361,12 @@ def compact_crosslink_hint(value: str) -> str:
     return raw
 
 
+@functools.lru_cache(maxsize=_CROSSREF_CACHE_SIZE)
 def _expand_wikipedia_ref(value: str) -> str:
     raw = value.strip()
     if not raw:
         return ""
-    if raw.startswith("http://") or raw.startswith("https://"):
+    if raw.startswith(_HTTP_SCHEMES):
         return raw
     if _HOSTED_REF_SEPARATOR in raw:
         host, title = raw.split(_HOSTED_REF_SEPARATOR, 1)
@@ -203,11 +379,12 @@ def _expand_wikipedia_ref(value: str) -> str:
     return f"{_WIKIPEDIA_PREFIX}{raw}"
 
 
+@functools.lru_cache(maxsize=_CROSSREF_CACHE_SIZE)
 def _expand_dbpedia_ref(value: str) -> str:
     raw = value.strip()
     if not raw:
         return ""
-    if raw.startswith("http://") or raw.startswith("https://"):
+    if raw.startswith(_HTTP_SCHEMES):
         return raw
     if _HOSTED_REF_SEPARATOR in raw:
         host, title = raw.split(_HOSTED_REF_SEPARATOR, 1)
@@ -229,24 +406,88 @@ def _require_psycopg() -> Any:
     return psycopg
 
 
+def _shared_connection_pool(dsn: str) -> Any | None:
+    if ConnectionPool is None:
+        return None
+    with _CONNECTION_POOLS_LOCK:
+        pool = _CONNECTION_POOLS.get(dsn)
+        if pool is not None:
+            return pool
+        pool = ConnectionPool(dsn, min_size=_POOL_MIN_SIZE, max_size=_POOL_MAX_SIZE, open=True)
+        try:
+            pool.wait(timeout=_POOL_OPEN_TIMEOUT_SECONDS)
+        except Exception as exc:  # pragma: no cover - connection issues are environment-specific
+            pool.close()
+            raise PostgresStoreError(f"Could not connect to Postgres: {exc}") from exc
+        _CONNECTION_POOLS[dsn] = pool
+        return pool
+
+
+@contextlib.contextmanager
+def _pooled_connection(pool: Any) -> Iterator[Any]:
+    with contextlib.ExitStack() as stack:
+        # Only the checkout is wrapped; errors raised by the caller's block still reach the pool unchanged.
+        try:
+            conn = stack.enter_context(pool.connection())
+        except Exception as exc:  # pragma: no cover - connection issues are environment-specific
+            raise PostgresStoreError(f"Could not connect to Postgres: {exc}") from exc
+        yield conn
+
+
+def _query_cache_lru_get(dsn: str, cache_key: str) -> dict[str, Any] | None:
+    with _QUERY_CACHE_LRU_LOCK:
+        cached = _QUERY_CACHE_LRU.get((dsn, cache_key))
+        if cached is None:
+            return None
+        expires_at, encoded = cached
+        if time.monotonic() >= expires_at:
+            del _QUERY_CACHE_LRU[(dsn, cache_key)]
+            return None
+        _QUERY_CACHE_LRU.move_to_end((dsn, cache_key))
+    return json_loads(encoded)
+
+
+def _query_cache_lru_put(dsn: str, cache_key: str, result: Mapping[str, Any]) -> None:
+    encoded = json_dumps_bytes(dict(result))
+    expires_at = time.monotonic() + _QUERY_CACHE_LRU_TTL_SECONDS
+    with _QUERY_CACHE_LRU_LOCK:
+        _QUERY_CACHE_LRU[(dsn, cache_key)] = (expires_at, encoded)
+        _QUERY_CACHE_LRU.move_to_end((dsn, cache_key))
+        while len(_QUERY_CACHE_LRU) > _QUERY_CACHE_LRU_SIZE:
+            _QUERY_CACHE_LRU.popitem(last=False)
+
+
+def _query_cache_lru_clear(dsn: str) -> None:
+    with _QUERY_CACHE_LRU_LOCK:
+        for key in [key for key in _QUERY_CACHE_LRU if key[0] == dsn]:
+            del _QUERY_CACHE_LRU[key]
+
+
 def _ordered_language_keys(values: Mapping[str, Any]) -> list[str]:
+    if not values:
+        return []
+    return list(_ordered_languages(frozenset(values)))
+
+
+@functools.lru_cache(maxsize=_LANGUAGE_ORDER_CACHE_SIZE)
+def _ordered_languages(languages: frozenset[str]) -> tuple[str, ...]:
     ordered: list[str] = []
     seen: set[str] = set()
     for language in _PRIMARY_LABEL_LANGUAGE_PREFERENCE:
-        if language in values and language not in seen:
+        if language in languages and language not in seen:
             seen.add(language)
             ordered.append(language)
-    for language in sorted(values):
+    for language in sorted(languages):
         if language in seen:
             continue
         ordered.append(language)
-    return ordered
+    return tuple(ordered)
 
 
 def _as_text_map(raw: Any) -> dict[str, str]:
     if isinstance(raw, str):
         try:
-            raw = json.loads(raw)
+            raw = json_loads(raw)
         except json.JSONDecodeError:
             return {}
     if not isinstance(raw, Mapping):
@@ -261,7 +502,7 @@ def _as_text_map(raw: Any) -> dict[str, str]:
 def _as_alias_map(raw: Any) -> dict[str, list[str]]:
     if isinstance(raw, str):
         try:
-            raw = json.loads(raw)
+            raw = json_loads(raw)
         except json.JSONDecodeError:
             return {}
     if not isinstance(raw, Mapping):
@@ -277,11 +518,14 @@ def _as_alias_map(raw: Any) -> dict[str, list[str]]:
 
 
 def _as_str_list(raw: Any) -> list[str]:
-    if isinstance(raw, str):
-        try:
-            raw = json.loads(raw)
-        except json.JSONDecodeError:
-            return []
+    if isinstance(raw, list):
+        return [item for item in raw if isinstance(item, str)]
+    if not isinstance(raw, str):
+        return []
+    try:
+        raw = json_loads(raw)
+    except json.JSONDecodeError:
+        return []
     if not isinstance(raw, list):
         return []
     return [item for item in raw if isinstance(item, str)]
@@ -290,7 +534,7 @@ def _as_str_list(raw: Any) -> list[str]:
 def _as_json_object(raw: Any) -> dict[str, Any]:
     if isinstance(raw, str):
         try:
-            raw = json.loads(raw)
+            raw = json_loads(raw)
         except json.JSONDecodeError:
             return {}
     if not isinstance(raw, Mapping):
@@ -298,16 +542,26 @@ def _as_json_object(raw: Any) -> dict[str, Any]:
     return {str(key): value for key, value in raw.items() if isinstance(key, str)}
 
 
-def _extract_sample_entity_label(raw_entity_json: Any) -> str | None:
-    if isinstance(raw_entity_json, str):
+def _as_cached_json_object(raw: Any) -> dict[str, Any] | None:
+    if isinstance(raw, dict):
+        # Decoded JSONB objects are fresh dicts with string keys; no need to copy them.
+        return raw
+    if isinstance(raw, str):
         try:
-            raw_entity_json = json.loads(raw_entity_json)
+            raw = json_loads(raw)
         except json.JSONDecodeError:
             return None
-    if not isinstance(raw_entity_json, Mapping):
+    if not isinstance(raw, Mapping):
         return None
+    return {str(key): value for key, value in raw.items() if isinstance(key, str)}
 
-    raw_labels = raw_entity_json.get("labels")
+
+def _extract_sample_entity_label(raw_labels: Any) -> str | None:
+    if isinstance(raw_labels, str):
+        try:
+            raw_labels = json_loads(raw_labels)
+        except json.JSONDecodeError:
+            return None
     if not isinstance(raw_labels, Mapping):
         return None
 
@@ -318,7 +572,7 @@ def _extract_sample_entity_label(raw_entity_json: Any) -> str | None:
         raw_value = payload.get("value")
         if not isinstance(raw_value, str):
             continue
-        normalized = normalize_text(raw_value)
+        normalized = _normalize_term(raw_value)
         if not normalized:
             continue
         preferred[language] = normalized
@@ -335,42 +589,6 @@ def _popularity_to_prior_local(popularity: float) -> float:
     return 1.0 - math.exp(-math.log1p(value) / 6.0)
 
 
-def _flatten_labels_map(labels: Mapping[str, str]) -> list[str]:
-    flattened: list[str] = []
-    seen: set[str] = set()
-    for language in _ordered_language_keys(labels):
-        raw_value = labels.get(language)
-        if not isinstance(raw_value, str):
-            continue
-        value = normalize_text(raw_value)
-        if not value or value in seen:
-            continue
-        seen.add(value)
-        flattened.append(value)
-    return flattened
-
-
-def _flatten_aliases_map(
-    aliases: Mapping[str, Sequence[str]],
-    *,
-    excluded: set[str] | None = None,
-) -> list[str]:
-    flattened: list[str] = []
-    seen: set[str] = set()
-    blocked = excluded if excluded is not None else set()
-    for language in _ordered_language_keys(aliases):
-        values = aliases.get(language, [])
-        for raw_alias in values:
-            if not isinstance(raw_alias, str):
-                continue
-            alias = normalize_text(raw_alias)
-            if not alias or alias in seen or alias in blocked:
-                continue
-            seen.add(alias)
-            flattened.append(alias)
-    return flattened
-
-
 def _join_terms(values: Sequence[str]) -> str:
     return " ".join(value for value in values if isinstance(value, str) and value)
 
@@ -392,7 +610,7 @@ def _normalize_name_terms(
     for raw_value in values:
         if not isinstance(raw_value, str):
             continue
-        value = normalize_text(raw_value)
+        value = _normalize_term(raw_value)
         if not value or value in seen or value in blocked:
             continue
         seen.add(value)
@@ -405,8 +623,28 @@ def _build_entity_name_sets(
     labels: Mapping[str, str],
     aliases: Mapping[str, Sequence[str]],
 ) -> tuple[list[str], list[str]]:
-    labels_flat = _flatten_labels_map(labels)
-    aliases_flat = _flatten_aliases_map(aliases, excluded=set(labels_flat))
+    languages = _ordered_languages(frozenset(labels).union(aliases)) if labels or aliases else ()
+    labels_flat: list[str] = []
+    aliases_flat: list[str] = []
+    seen: set[str] = set()
+    for language in languages:
+        raw_value = labels.get(language)
+        if not isinstance(raw_value, str):
+            continue
+        value = _normalize_term(raw_value)
+        if not value or value in seen:
+            continue
+        seen.add(value)
+        labels_flat.append(value)
+    for language in languages:
+        for raw_alias in aliases.get(language, ()):
+            if not isinstance(raw_alias, str):
+                continue
+            alias = _normalize_term(raw_alias)
+            if not alias or alias in seen:
+                continue
+            seen.add(alias)
+            aliases_flat.append(alias)
     return labels_flat, aliases_flat
 
 
@@ -416,7 +654,7 @@ def _build_search_texts_from_name_sets(
     labels: Sequence[str],
     aliases: Sequence[str],
 ) -> tuple[str, str]:
-    primary_label_normalized = normalize_text(label) if isinstance(label, str) else ""
+    primary_label_normalized = _normalize_term(label) if isinstance(label, str) else ""
     secondary_labels = [
         value
         for value in _normalize_name_terms(labels)
@@ -428,7 +666,7 @@ def _build_search_texts_from_name_sets(
 
 def _legacy_label_values(label: Any, raw_labels: Any) -> list[str]:
     labels = _normalize_name_terms(_as_str_list(raw_labels))
-    primary_label = normalize_text(label) if isinstance(label, str) else ""
+    primary_label = _normalize_term(label) if isinstance(label, str) else ""
     if not primary_label:
         return labels
     if primary_label in labels:
@@ -580,6 +818,27 @@ def _entity_search_columns(
     }
 
 
+def _lookup_payloads_to_candidates(payloads: Iterable[Any]) -> list[dict[str, Any]]:
+    candidates: list[dict[str, Any]] = []
+    for payload in payloads:
+        if not isinstance(payload, dict):
+            continue
+        wikipedia_url = payload.pop("wikipedia_url", "")
+        dbpedia_url = payload.pop("dbpedia_url", "")
+        cross_refs: dict[str, str] = {}
+        if wikipedia_url:
+            cross_refs["wikipedia"] = _expand_wikipedia_ref(wikipedia_url)
+        if dbpedia_url:
+            cross_refs["dbpedia"] = _expand_dbpedia_ref(dbpedia_url)
+        for key in ("popularity", "prior", "score"):
+            value = payload.get(key)
+            payload[key] = float(value) if isinstance(value, (int, float)) else 0.0
+        payload["context_string"] = ""
+        payload["cross_refs"] = cross_refs
+        candidates.append(payload)
+    return candidates
+
+
 def build_entity_context_string(
     *,
     related_labels: Sequence[str],
@@ -614,13 +873,20 @@ class PostgresStore:
         if not self.dsn:
             raise ValueError("Postgres DSN must be non-empty.")
 
-    def _connect(self) -> Any:
+    def _open_connection(self) -> Any:
         pg = _require_psycopg()
         try:
             return pg.connect(self.dsn)
         except Exception as exc:  # pragma: no cover - connection issues are environment-specific
             raise PostgresStoreError(f"Could not connect to Postgres: {exc}") from exc
 
+    def _connect(self) -> Any:
+        _require_psycopg()
+        pool = _shared_connection_pool(self.dsn)
+        if pool is None:
+            return self._open_connection()
+        return _pooled_connection(pool)
+
     def _table_exists(self, conn: Any, table_name: str) -> bool:
         with conn.cursor() as cur:
             cur.execute("SELECT to_regclass(%s)", (table_name,))
@@ -649,17 +915,34 @@ class PostgresStore:
     ) -> None:
         if not rows:
             return
-        sql = """
-        UPDATE entities
-        SET labels = %s::text[],
-            aliases = %s::text[],
-            updated_at = NOW()
-        WHERE qid = %s
-          AND COALESCE(array_length(labels, 1), 0) = 0
-          AND COALESCE(array_length(aliases, 1), 0) = 0
-        """
         with conn.cursor() as cur:
-            cur.executemany(sql, [(labels, aliases, qid) for qid, labels, aliases in rows])
+            cur.execute(
+                f"""
+                CREATE TEMP TABLE IF NOT EXISTS {_ENTITY_NAME_STAGE_TABLE} (
+                    qid TEXT PRIMARY KEY,
+                    labels TEXT[] NOT NULL,
+                    aliases TEXT[] NOT NULL
+                ) ON COMMIT DROP
+                """
+            )
+            cur.execute(f"TRUNCATE {_ENTITY_NAME_STAGE_TABLE}")
+            deduped = {qid: (qid, labels, aliases) for qid, labels, aliases in rows}
+            with cur.copy(f"COPY {_ENTITY_NAME_STAGE_TABLE} (qid, labels, aliases) FROM STDIN") as copy:
+                for values in deduped.values():
+                    copy.write_row(values)
+            cur.execute(f"ANALYZE {_ENTITY_NAME_STAGE_TABLE}")
+            cur.execute(
+                f"""
+                UPDATE entities AS e
+                SET labels = s.labels,
+                    aliases = s.aliases,
+                    updated_at = NOW()
+                FROM {_ENTITY_NAME_STAGE_TABLE} AS s
+                WHERE e.qid = s.qid
+                  AND COALESCE(array_length(e.labels, 1), 0) = 0
+                  AND COALESCE(array_length(e.aliases, 1), 0) = 0
+                """
+            )
 
     def _migrate_legacy_entity_names_to_entities(
         self,
@@ -764,6 +1047,18 @@ class PostgresStore:
             source_url TEXT NOT NULL DEFAULT '',
             updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
         );
+        CREATE INDEX IF NOT EXISTS idx_sample_entity_cache_qid_num
+            ON sample_entity_cache ((CAST(SUBSTRING(qid FROM 2) AS BIGINT)), qid)
+            WHERE qid ~ '^Q[0-9]+$';
+
+        CREATE TABLE IF NOT EXISTS sample_entity_negative_cache (
+            qid TEXT PRIMARY KEY,
+            http_status INTEGER NOT NULL,
+            last_seen TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        CREATE INDEX IF NOT EXISTS idx_sample_entity_negative_cache_qid_num
+            ON sample_entity_negative_cache ((CAST(SUBSTRING(qid FROM 2) AS BIGINT)), qid)
+            WHERE qid ~ '^Q[0-9]+$';
 
         ALTER TABLE entities ADD COLUMN IF NOT EXISTS description TEXT;
         ALTER TABLE entities ADD COLUMN IF NOT EXISTS labels TEXT[] NOT NULL DEFAULT ARRAY[]::text[];
@@ -777,6 +1072,7 @@ class PostgresStore:
         ALTER TABLE entities ADD COLUMN IF NOT EXISTS wikipedia_url TEXT NOT NULL DEFAULT '';
         ALTER TABLE entities ADD COLUMN IF NOT EXISTS dbpedia_url TEXT NOT NULL DEFAULT '';
         ALTER TABLE entities DROP COLUMN IF EXISTS context_string;
+        ALTER TABLE sample_entity_cache ADD COLUMN IF NOT EXISTS payload_kind TEXT NOT NULL DEFAULT 'full';
         """
         with self._connect() as conn:
             with conn.cursor() as cur:
@@ -837,6 +1133,7 @@ class PostgresStore:
             )
         drop_parts = [
             f"DROP INDEX IF EXISTS {_quote_identifier(f'{index_prefix}_item_category')};",
+            f"DROP INDEX IF EXISTS {_quote_identifier(f'{index_prefix}_updated_at')};",
         ]
         if table_name == "entities":
             drop_parts.extend(_entity_triples_index_drop_statements())
@@ -845,7 +1142,7 @@ class PostgresStore:
         CREATE INDEX IF NOT EXISTS {index_prefix}_coarse_type ON {table_ident} (coarse_type);
         CREATE INDEX IF NOT EXISTS {index_prefix}_fine_type ON {table_ident} (fine_type);
         CREATE INDEX IF NOT EXISTS {index_prefix}_label_lower ON {table_ident} (LOWER(label));
-        CREATE INDEX IF NOT EXISTS {index_prefix}_updated_at ON {table_ident} (updated_at);
+        CREATE INDEX IF NOT EXISTS {index_prefix}_updated_at_brin ON {table_ident} USING BRIN (updated_at);
         CREATE INDEX IF NOT EXISTS {index_prefix}_wikipedia_url ON {table_ident} (wikipedia_url)
         WHERE COALESCE(wikipedia_url, '') <> '';
         CREATE INDEX IF NOT EXISTS {index_prefix}_dbpedia_url ON {table_ident} (dbpedia_url)
@@ -865,60 +1162,91 @@ class PostgresStore:
     ) -> int:
         if not rows:
             return 0
-        sql = """
-        INSERT INTO entities (
-            qid, label, labels, aliases, description, types, coarse_type, fine_type,
-            item_category, popularity, prior, wikipedia_url, dbpedia_url
-        ) VALUES (
-            %s, %s, %s::text[], %s::text[], %s, %s::text[], %s, %s,
-            %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (qid) DO UPDATE SET
-            label = EXCLUDED.label,
-            labels = EXCLUDED.labels,
-            aliases = EXCLUDED.aliases,
-            description = EXCLUDED.description,
-            types = EXCLUDED.types,
-            coarse_type = EXCLUDED.coarse_type,
-            fine_type = EXCLUDED.fine_type,
-            item_category = EXCLUDED.item_category,
-            popularity = EXCLUDED.popularity,
-            prior = EXCLUDED.prior,
-            wikipedia_url = EXCLUDED.wikipedia_url,
-            dbpedia_url = EXCLUDED.dbpedia_url,
-            updated_at = NOW()
-        """
-        payload: list[tuple[Any, ...]] = []
-        for row in rows:
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                stored = self._stage_and_merge_entities(cur, rows)
+            conn.commit()
+        return stored
+
+    def _stage_and_merge_entities(self, cur: Any, rows: Sequence[EntityRecord]) -> int:
+        latest_by_qid = {row.qid: row for row in rows}
+        qids: list[str] = []
+        labels: list[str] = []
+        label_sets: list[list[str]] = []
+        alias_sets: list[list[str]] = []
+        descriptions: list[str | None] = []
+        types: list[list[str]] = []
+        coarse_types: list[str] = []
+        fine_types: list[str] = []
+        item_categories: list[str] = []
+        popularities: list[float] = []
+        priors: list[float] = []
+        wikipedia_urls: list[str] = []
+        dbpedia_urls: list[str] = []
+        for row in latest_by_qid.values():
+            popularity = float(row.popularity)
             search_cols = _entity_search_columns(
                 label=row.label,
                 labels=row.labels,
                 aliases=row.aliases,
                 cross_refs=row.cross_refs,
-                popularity=float(row.popularity),
+                popularity=popularity,
             )
-            payload.append(
-                (
-                    row.qid,
-                    row.label,
-                    list(search_cols["labels"]),
-                    list(search_cols["aliases"]),
-                    row.description,
-                    list(row.types),
-                    row.coarse_type,
-                    row.fine_type,
-                    row.item_category,
-                    float(row.popularity),
-                    float(search_cols["prior"]),
-                    str(search_cols["wikipedia_url"]),
-                    str(search_cols["dbpedia_url"]),
-                )
-            )
-        with self._connect() as conn:
-            with conn.cursor() as cur:
-                cur.executemany(sql, payload)
-            conn.commit()
-        return len(payload)
+            qids.append(row.qid)
+            labels.append(row.label)
+            label_sets.append(list(search_cols["labels"]))
+            alias_sets.append(list(search_cols["aliases"]))
+            descriptions.append(row.description)
+            types.append(list(row.types))
+            coarse_types.append(row.coarse_type)
+            fine_types.append(row.fine_type)
+            item_categories.append(row.item_category)
+            popularities.append(popularity)
+            priors.append(float(search_cols["prior"]))
+            wikipedia_urls.append(str(search_cols["wikipedia_url"]))
+            dbpedia_urls.append(str(search_cols["dbpedia_url"]))
+        columns_sql = ", ".join(_ENTITY_UPSERT_COLUMNS)
+        changed_columns_sql = ", ".join(f"entities.{column}" for column in _ENTITY_UPSERT_COLUMNS[1:])
+        excluded_columns_sql = ", ".join(f"EXCLUDED.{column}" for column in _ENTITY_UPSERT_COLUMNS[1:])
+        update_sql = ",\n            ".join(
+            f"{column} = EXCLUDED.{column}" for column in _ENTITY_UPSERT_COLUMNS if column != "qid"
+        )
+        cur.execute(
+            f"CREATE TEMP TABLE {_ENTITY_UPSERT_STAGE_TABLE} "
+            "(LIKE entities INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        with cur.copy(
+            f"COPY {_ENTITY_UPSERT_STAGE_TABLE} ({columns_sql}) FROM STDIN (FORMAT BINARY)"
+        ) as copy:
+            copy.set_types(list(_ENTITY_UPSERT_COPY_TYPES))
+            for values in zip(
+                qids,
+                labels,
+                label_sets,
+                alias_sets,
+                descriptions,
+                types,
+                coarse_types,
+                fine_types,
+                item_categories,
+                popularities,
+                priors,
+                wikipedia_urls,
+                dbpedia_urls,
+            ):
+                copy.write_row(values)
+        cur.execute(
+            f"""
+            INSERT INTO entities ({columns_sql})
+            SELECT {columns_sql}
+            FROM {_ENTITY_UPSERT_STAGE_TABLE}
+            ON CONFLICT (qid) DO UPDATE SET
+                {update_sql},
+                updated_at = NOW()
+            WHERE ({changed_columns_sql}) IS DISTINCT FROM ({excluded_columns_sql})
+            """
+        )
+        return len(qids)
 
     def upsert_entity_triples(
         self,
@@ -926,25 +1254,33 @@ class PostgresStore:
     ) -> int:
         if not rows:
             return 0
-        sql = """
-        INSERT INTO entity_triples (subject_qid, predicate_pid, object_qid, updated_at)
-        VALUES (%s, %s, %s, NOW())
-        ON CONFLICT (subject_qid, predicate_pid, object_qid) DO UPDATE SET
-            updated_at = NOW()
-        """
-        payload = [
-            (row.subject_qid, row.predicate_pid, row.object_qid)
-            for row in rows
-            if row.subject_qid and row.predicate_pid and row.object_qid
-        ]
+        payload = list(
+            dict.fromkeys(
+                (row.subject_qid, row.predicate_pid, row.object_qid)
+                for row in rows
+                if row.subject_qid and row.predicate_pid and row.object_qid
+            )
+        )
         if not payload:
             return 0
         with self._connect() as conn:
-            with conn.cursor() as cur:
-                cur.executemany(sql, payload)
+            with conn.pipeline(), conn.cursor() as cur:
+                self._insert_entity_triple_rows(cur, payload)
             conn.commit()
         return len(payload)
 
+    def _insert_entity_triple_rows(self, cur: Any, payload: Sequence[tuple[str, str, str]]) -> None:
+        for row_count, params in _iter_value_chunks(payload):
+            cur.execute(
+                f"""
+                INSERT INTO entity_triples (subject_qid, predicate_pid, object_qid, updated_at)
+                VALUES {_multi_row_values_sql("(%s, %s, %s, NOW())", row_count)}
+                ON CONFLICT (subject_qid, predicate_pid, object_qid) DO UPDATE SET
+                    updated_at = NOW()
+                """,
+                params,
+            )
+
     def replace_entity_triples(
         self,
         *,
@@ -954,42 +1290,54 @@ class PostgresStore:
         normalized_subjects = [qid for qid in subject_qids if isinstance(qid, str) and qid]
         if not normalized_subjects:
             return 0
-        payload = [
-            (row.subject_qid, row.predicate_pid, row.object_qid)
-            for row in rows
-            if row.subject_qid and row.predicate_pid and row.object_qid
-        ]
-        insert_sql = """
-        INSERT INTO entity_triples (subject_qid, predicate_pid, object_qid, updated_at)
-        VALUES (%s, %s, %s, NOW())
-        ON CONFLICT (subject_qid, predicate_pid, object_qid) DO UPDATE SET
-            updated_at = NOW()
-        """
+        payload = list(
+            dict.fromkeys(
+                (row.subject_qid, row.predicate_pid, row.object_qid)
+                for row in rows
+                if row.subject_qid and row.predicate_pid and row.object_qid
+            )
+        )
+        subject_set = set(normalized_subjects)
+        # After the DELETE, rows for these subjects cannot conflict, so large batches can be
+        # streamed with COPY instead of going through ON CONFLICT upserts.
+        use_copy = len(payload) >= _COPY_MIN_ROWS and all(row[0] in subject_set for row in payload)
         with self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    "DELETE FROM entity_triples WHERE subject_qid = ANY(%s)",
-                    (list(normalized_subjects),),
-                )
-                if payload:
-                    cur.executemany(insert_sql, payload)
+                # COPY cannot run in pipeline mode, so it starts once the DELETE has been synced.
+                with conn.pipeline():
+                    cur.execute(
+                        "DELETE FROM entity_triples WHERE subject_qid = ANY(%s)",
+                        (list(normalized_subjects),),
+                    )
+                    if payload and not use_copy:
+                        self._insert_entity_triple_rows(cur, payload)
+                if use_copy:
+                    with cur.copy(
+                        "COPY entity_triples (subject_qid, predicate_pid, object_qid) FROM STDIN"
+                    ) as copy:
+                        for row in payload:
+                            copy.write_row(row)
             conn.commit()
         return len(payload)
 
     def iter_entity_ids(self, *, batch_size: int) -> Iterator[list[str]]:
         if batch_size <= 0:
             raise ValueError("batch_size must be > 0")
-        sql = "SELECT qid FROM entities ORDER BY qid"
-        with self._connect() as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql)
-                while True:
-                    rows = cur.fetchmany(batch_size)
-                    if not rows:
-                        return
-                    batch = [row[0] for row in rows if row and isinstance(row[0], str)]
-                    if batch:
-                        yield batch
+        sql = "SELECT qid FROM entities WHERE qid > %s ORDER BY qid LIMIT %s"
+        last_qid = ""
+        while True:
+            with self._connect() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(sql, (last_qid, batch_size))
+                    rows = cur.fetchall()
+            if not rows:
+                return
+            last_qid = rows[-1][0]
+            batch = [row[0] for row in rows if row and isinstance(row[0], str)]
+            if batch:
+                yield batch
+            if len(rows) < batch_size:
+                return
 
     def load_context_inputs(self, qids: Sequence[str]) -> list[tuple[str, list[str]]]:
         if not qids:
@@ -999,11 +1347,12 @@ class PostgresStore:
             subject_qid,
             array_agg(DISTINCT object_qid ORDER BY object_qid) AS object_qids
         FROM entity_triples
-        WHERE subject_qid = ANY(%s)
+        WHERE subject_qid IN (SELECT unnest(%s::text[]))
         GROUP BY subject_qid
+        ORDER BY subject_qid COLLATE "C"
         """
         with self._connect() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(binary=True) as cur:
                 cur.execute(sql, (list(qids),))
                 rows = cur.fetchall()
         out: list[tuple[str, list[str]]] = []
@@ -1011,7 +1360,6 @@ class PostgresStore:
             if not isinstance(qid, str):
                 continue
             out.append((qid, _as_str_list(related)))
-        out.sort(key=lambda item: item[0])
         return out
 
     def load_entity_triple_neighbors(
@@ -1041,7 +1389,7 @@ class PostgresStore:
             predicate_pid,
             object_qid
         FROM entity_triples
-        WHERE subject_qid = ANY(%s)
+        WHERE subject_qid IN (SELECT unnest(%s::text[]))
         ORDER BY subject_qid, predicate_pid, object_qid
         """
         incoming_sql = """
@@ -1050,7 +1398,7 @@ class PostgresStore:
             predicate_pid,
             subject_qid
         FROM entity_triples
-        WHERE object_qid = ANY(%s)
+        WHERE object_qid IN (SELECT unnest(%s::text[]))
         ORDER BY object_qid, predicate_pid, subject_qid
         """
         with self._connect() as conn:
@@ -1079,26 +1427,31 @@ class PostgresStore:
     def resolve_labels(self, qids: Sequence[str]) -> dict[str, str]:
         if not qids:
             return {}
+        # Only ship the labels object of cached entity payloads; claims dominate their size.
         sql = """
-        SELECT qid, label
-        FROM entities
-        WHERE qid = ANY(%s)
+        SELECT q.qid, e.label, s.entity_json -> 'labels'
+        FROM (SELECT DISTINCT unnest(%s::text[]) AS qid) AS q
+        LEFT JOIN entities AS e ON e.qid = q.qid
+        LEFT JOIN sample_entity_cache AS s
+            ON s.qid = q.qid
+           AND (e.label IS NULL OR e.label !~ '\\S')
         """
         with self._connect() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(binary=True) as cur:
                 cur.execute(sql, (list(qids),))
                 rows = cur.fetchall()
         resolved: dict[str, str] = {}
-        for qid, label in rows:
+        for qid, label, raw_labels in rows:
             if not isinstance(qid, str):
                 continue
             if isinstance(label, str) and label.strip():
                 resolved[qid] = label.strip()
-        missing = [qid for qid in qids if isinstance(qid, str) and qid not in resolved]
-        if missing:
-            for qid, label in self.resolve_sample_cache_labels(missing).items():
-                if qid not in resolved and label:
-                    resolved[qid] = label
+                continue
+            if raw_labels is None:
+                continue
+            sample_label = _extract_sample_entity_label(raw_labels)
+            if sample_label:
+                resolved[qid] = sample_label
         return resolved
 
     def build_context_strings(
@@ -1178,19 +1531,19 @@ class PostgresStore:
         if not qids:
             return {}
         sql = """
-        SELECT qid, entity_json
+        SELECT qid, entity_json -> 'labels'
         FROM sample_entity_cache
-        WHERE qid = ANY(%s)
+        WHERE qid IN (SELECT unnest(%s::text[]))
         """
         with self._connect() as conn:
             with conn.cursor() as cur:
                 cur.execute(sql, (list(qids),))
                 rows = cur.fetchall()
         resolved: dict[str, str] = {}
-        for qid, entity_json in rows:
+        for qid, raw_labels in rows:
             if not isinstance(qid, str):
                 continue
-            label = _extract_sample_entity_label(entity_json)
+            label = _extract_sample_entity_label(raw_labels)
             if label:
                 resolved[qid] = label
         return resolved
@@ -1201,7 +1554,7 @@ class PostgresStore:
         sql = """
         SELECT qid, labels, aliases
         FROM entities
-        WHERE qid = ANY(%s)
+        WHERE qid IN (SELECT unnest(%s::text[]))
         """
         with self._connect() as conn:
             with conn.cursor() as cur:
@@ -1231,106 +1584,65 @@ class PostgresStore:
             qid, label, labels, aliases, description, types,
             coarse_type, fine_type, item_category, popularity, prior, wikipedia_url, dbpedia_url
         FROM entities
+        WHERE qid > %s
         ORDER BY qid
+        LIMIT %s
         """
-        with self._connect() as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql)
-                while True:
-                    rows = cur.fetchmany(batch_size)
-                    if not rows:
-                        return
-                    out: list[dict[str, Any]] = []
-                    for row in rows:
-                        if len(row) < 13:
-                            continue
-                        qid = row[0]
-                        label = row[1]
-                        if not isinstance(qid, str) or not isinstance(label, str):
-                            continue
-                        labels = _as_str_list(row[2])
-                        aliases = _as_str_list(row[3])
-                        out.append(
-                            {
-                                "qid": qid,
-                                "label": label,
-                                "labels": labels,
-                                "aliases": aliases,
-                                "description": row[4] if isinstance(row[4], str) else None,
-                                "types": _as_str_list(row[5]),
-                                "coarse_type": row[6] if isinstance(row[6], str) else "",
-                                "fine_type": row[7] if isinstance(row[7], str) else "",
-                                "item_category": row[8] if isinstance(row[8], str) else "",
-                                "popularity": float(row[9]) if isinstance(row[9], (int, float)) else 0.0,
-                                "prior": float(row[10]) if isinstance(row[10], (int, float)) else 0.0,
-                                "cross_refs": {
-                                    key: value
-                                    for key, value in (
-                                        (
-                                            "wikipedia",
-                                            _expand_wikipedia_ref(row[11]) if isinstance(row[11], str) else "",
-                                        ),
-                                        (
-                                            "dbpedia",
-                                            _expand_dbpedia_ref(row[12]) if isinstance(row[12], str) else "",
-                                        ),
-                                    )
-                                    if value
-                                },
-                            }
-                        )
-                    if out:
-                        yield self.attach_context_strings(
-                            out,
-                            chunk_size=min(2000, max(1, batch_size)),
-                        )
-
-    def _lookup_rows_to_candidates(self, rows: Sequence[Sequence[Any]]) -> list[dict[str, Any]]:
-        candidates: list[dict[str, Any]] = []
-        for row in rows:
-            if len(row) < 14:
-                continue
-            qid = row[0]
-            label = row[1]
-            if not isinstance(qid, str) or not isinstance(label, str):
-                continue
-            labels = _as_str_list(row[2])
-            aliases = _as_str_list(row[3])
-            popularity = row[9] if isinstance(row[9], (int, float)) else 0.0
-            prior = row[10] if isinstance(row[10], (int, float)) else _popularity_to_prior_local(float(popularity))
-            score = row[13] if isinstance(row[13], (int, float)) else 0.0
-            candidates.append(
-                {
-                    "qid": qid,
-                    "label": label,
-                    "labels": labels,
-                    "aliases": aliases,
-                    "description": row[4] if isinstance(row[4], str) else None,
-                    "types": _as_str_list(row[5]),
-                    "context_string": "",
-                    "coarse_type": row[6] if isinstance(row[6], str) else "",
-                    "fine_type": row[7] if isinstance(row[7], str) else "",
-                    "item_category": row[8] if isinstance(row[8], str) else "",
-                    "popularity": float(popularity),
-                    "prior": float(prior),
-                    "cross_refs": {
-                        key: value
-                        for key, value in (
-                            (
-                                "wikipedia",
-                                _expand_wikipedia_ref(row[11]) if isinstance(row[11], str) else "",
-                            ),
-                            (
-                                "dbpedia",
-                                _expand_dbpedia_ref(row[12]) if isinstance(row[12], str) else "",
-                            ),
-                        )
-                        if value
-                    },
-                    "score": float(score),
-                }
-            )
-        return candidates
+        last_qid = ""
+        while True:
+            with self._connect() as conn:
+                with conn.cursor(binary=True) as cur:
+                    cur.execute(sql, (last_qid, batch_size))
+                    rows = cur.fetchall()
+            if not rows:
+                return
+            last_qid = rows[-1][0]
+            out: list[dict[str, Any]] = []
+            for row in rows:
+                if len(row) < 13:
+                    continue
+                qid = row[0]
+                label = row[1]
+                if not isinstance(qid, str) or not isinstance(label, str):
+                    continue
+                labels = _as_str_list(row[2])
+                aliases = _as_str_list(row[3])
+                out.append(
+                    {
+                        "qid": qid,
+                        "label": label,
+                        "labels": labels,
+                        "aliases": aliases,
+                        "description": row[4] if isinstance(row[4], str) else None,
+                        "types": _as_str_list(row[5]),
+                        "coarse_type": row[6] if isinstance(row[6], str) else "",
+                        "fine_type": row[7] if isinstance(row[7], str) else "",
+                        "item_category": row[8] if isinstance(row[8], str) else "",
+                        "popularity": float(row[9]) if isinstance(row[9], (int, float)) else 0.0,
+                        "prior": float(row[10]) if isinstance(row[10], (int, float)) else 0.0,
+                        "cross_refs": {
+                            key: value
+                            for key, value in (
+                                (
+                                    "wikipedia",
+                                    _expand_wikipedia_ref(row[11]) if isinstance(row[11], str) else "",
+                                ),
+                                (
+                                    "dbpedia",
+                                    _expand_dbpedia_ref(row[12]) if isinstance(row[12], str) else "",
+                                ),
+                            )
+                            if value
+                        },
+                    }
+                )
+            if out:
+                yield self.attach_context_strings(
+                    out,
+                    chunk_size=min(2000, max(1, batch_size)),
+                )
+            if len(rows) < batch_size:
+                return
 
     def search_candidates_exact(
         self,
@@ -1357,97 +1669,38 @@ class PostgresStore:
         if not mention_query or size <= 0:
             return []
         exact_crosslinks = [value for value in crosslink_exact if isinstance(value, str) and value]
-        mention_like = f"%{mention_query}%"
-        base_match_sql = (
-            "("
-            "LOWER(label) = LOWER(%s) OR "
-            "label ILIKE %s OR "
-            "EXISTS (SELECT 1 FROM unnest(labels) AS v WHERE LOWER(v) = LOWER(%s)) OR "
-            "EXISTS (SELECT 1 FROM unnest(labels) AS v WHERE v ILIKE %s) OR "
-            "EXISTS (SELECT 1 FROM unnest(aliases) AS v WHERE LOWER(v) = LOWER(%s)) OR "
-            "EXISTS (SELECT 1 FROM unnest(aliases) AS v WHERE v ILIKE %s)"
-        )
-        params: list[Any] = [
-            mention_query,
-            mention_like,
-            mention_query,
-            mention_like,
-            mention_query,
-            mention_like,
-        ]
-        if exact_crosslinks:
-            base_match_sql += " OR wikipedia_url = ANY(%s) OR dbpedia_url = ANY(%s)"
-            params.extend([list(exact_crosslinks), list(exact_crosslinks)])
-        base_match_sql += ")"
-        where_parts = [base_match_sql]
+        params: list[Any] = []
         if coarse_hints:
-            where_parts.append("coarse_type = ANY(%s)")
             params.append(list(coarse_hints))
         if fine_hints:
-            where_parts.append("fine_type = ANY(%s)")
             params.append(list(fine_hints))
-
-        sql = f"""
-        SELECT
-            qid, label, labels, aliases, description, types,
-            coarse_type, fine_type, item_category, popularity, prior, wikipedia_url, dbpedia_url,
-            (
-                CASE WHEN LOWER(label) = LOWER(%s) THEN 4.0 ELSE 0.0 END +
-                CASE WHEN EXISTS (SELECT 1 FROM unnest(labels) AS v WHERE LOWER(v) = LOWER(%s)) THEN 3.0 ELSE 0.0 END +
-                CASE WHEN EXISTS (SELECT 1 FROM unnest(aliases) AS v WHERE LOWER(v) = LOWER(%s)) THEN 2.5 ELSE 0.0 END +
-                CASE WHEN label ILIKE %s THEN 1.5 ELSE 0.0 END +
-                CASE WHEN EXISTS (SELECT 1 FROM unnest(labels) AS v WHERE v ILIKE %s) THEN 1.25 ELSE 0.0 END +
-                CASE WHEN EXISTS (SELECT 1 FROM unnest(aliases) AS v WHERE v ILIKE %s) THEN 1.0 ELSE 0.0 END +
-                CASE
-                    WHEN %s THEN
-                        CASE
-                            WHEN wikipedia_url = ANY(%s) OR dbpedia_url = ANY(%s) THEN 1.5
-                            ELSE 0.0
-                        END
-                    ELSE 0.0
-                END
-            ) AS score
-        FROM entities
-        WHERE {' AND '.join(where_parts)}
-        ORDER BY score DESC, prior DESC, qid ASC
-        LIMIT %s
-        """
+        sql = _fuzzy_candidates_sql(bool(exact_crosslinks), bool(coarse_hints), bool(fine_hints))
         score_params = [
             mention_query,
-            mention_query,
-            mention_query,
-            mention_like,
-            mention_like,
-            mention_like,
-            bool(exact_crosslinks),
-            list(exact_crosslinks),
+            f"%{mention_query}%",
             list(exact_crosslinks),
         ]
         with self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (*score_params, *params, int(size)))
+                cur.execute(sql, (*score_params, *params, int(size)), prepare=True)
                 rows = cur.fetchall()
-        return self.attach_context_strings(self._lookup_rows_to_candidates(rows))
+        return self.attach_context_strings(_lookup_payloads_to_candidates(row[0] for row in rows))
 
     def get_query_cache(self, cache_key: str) -> dict[str, Any] | None:
+        cached = _query_cache_lru_get(self.dsn, cache_key)
+        if cached is not None:
+            return cached
         sql = "SELECT result FROM query_cache WHERE cache_key = %s"
         with self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (cache_key,))
+                cur.execute(sql, (cache_key,), prepare=True)
                 row = cur.fetchone()
         if not row:
             return None
-        raw = row[0]
-        if isinstance(raw, Mapping):
-            return {str(k): v for k, v in raw.items() if isinstance(k, str)}
-        if isinstance(raw, str):
-            try:
-                parsed = json.loads(raw)
-            except json.JSONDecodeError:
-                return None
-            if isinstance(parsed, Mapping):
-                return {str(k): v for k, v in parsed.items() if isinstance(k, str)}
-        return None
+        parsed = _as_cached_json_object(row[0])
+        if parsed is not None:
+            _query_cache_lru_put(self.dsn, cache_key, parsed)
+        return parsed
 
     def put_query_cache(self, cache_key: str, result: Mapping[str, Any]) -> None:
         sql = """
@@ -1459,8 +1712,9 @@ class PostgresStore:
         """
         with self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (cache_key, _json_compact(dict(result))))
+                cur.execute(sql, (cache_key, _json_compact(dict(result))), prepare=True)
             conn.commit()
+        _query_cache_lru_put(self.dsn, cache_key, result)
 
     def get_sample_entities(self, qids: Sequence[str]) -> dict[str, dict[str, Any]]:
         if not qids:
@@ -1468,28 +1722,121 @@ class PostgresStore:
         sql = """
         SELECT qid, entity_json
         FROM sample_entity_cache
-        WHERE qid = ANY(%s)
+        WHERE qid IN (SELECT unnest(%s::text[]))
+          AND payload_kind = 'full'
         """
         with self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (list(qids),))
+                cur.execute(sql, (list(qids),), prepare=True)
                 rows = cur.fetchall()
         out: dict[str, dict[str, Any]] = {}
         for qid, payload in rows:
-            if not isinstance(qid, str):
-                continue
-            if isinstance(payload, Mapping):
-                out[qid] = {str(k): v for k, v in payload.items() if isinstance(k, str)}
-                continue
-            if isinstance(payload, str):
-                try:
-                    parsed = json.loads(payload)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(parsed, Mapping):
-                    out[qid] = {str(k): v for k, v in parsed.items() if isinstance(k, str)}
+            parsed = _as_cached_json_object(payload)
+            if isinstance(qid, str) and parsed is not None:
+                out[qid] = parsed
         return out
 
+    def existing_sample_entity_ids(
+        self,
+        qids: Sequence[str],
+        *,
+        include_labels_only: bool = False,
+    ) -> set[str]:
+        if not qids:
+            return set()
+        # Cache probes only need membership; skip detoasting and decoding entity_json.
+        sql = """
+        SELECT qid
+        FROM sample_entity_cache
+        WHERE qid IN (SELECT unnest(%s::text[]))
+          AND (%s OR payload_kind = 'full')
+        """
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (list(qids), bool(include_labels_only)), prepare=True)
+                rows = cur.fetchall()
+        return {row[0] for row in rows if row and isinstance(row[0], str)}
+
+    def sample_entity_ids_in_range(self, first_qid_num: int, last_qid_num: int) -> set[str]:
+        if last_qid_num < first_qid_num:
+            return set()
+        sql = """
+        SELECT qid
+        FROM sample_entity_cache
+        WHERE qid ~ '^Q[0-9]+$'
+          AND CAST(SUBSTRING(qid FROM 2) AS BIGINT) BETWEEN %s AND %s
+          AND payload_kind = 'full'
+        """
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (int(first_qid_num), int(last_qid_num)), prepare=True)
+                rows = cur.fetchall()
+        return {row[0] for row in rows if row and isinstance(row[0], str)}
+
+    def negative_sample_entity_ids_in_range(
+        self,
+        first_qid_num: int,
+        last_qid_num: int,
+        *,
+        max_age_seconds: int,
+    ) -> set[str]:
+        if last_qid_num < first_qid_num or max_age_seconds <= 0:
+            return set()
+        sql = """
+        SELECT qid
+        FROM sample_entity_negative_cache
+        WHERE qid ~ '^Q[0-9]+$'
+          AND CAST(SUBSTRING(qid FROM 2) AS BIGINT) BETWEEN %s AND %s
+          AND last_seen >= (NOW() - (%s * INTERVAL '1 second'))
+        """
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql,
+                    (int(first_qid_num), int(last_qid_num), int(max_age_seconds)),
+                    prepare=True,
+                )
+                rows = cur.fetchall()
+        return {row[0] for row in rows if row and isinstance(row[0], str)}
+
+    def record_negative_sample_entities(self, rows: Sequence[tuple[str, int]]) -> int:
+        if not rows:
+            return 0
+        payload = list({qid: (qid, int(http_status)) for qid, http_status in rows}.values())
+        with self._connect() as conn:
+            with conn.pipeline(), conn.cursor() as cur:
+                for row_count, params in _iter_value_chunks(payload):
+                    cur.execute(
+                        f"""
+                        INSERT INTO sample_entity_negative_cache (qid, http_status, last_seen)
+                        VALUES {_multi_row_values_sql("(%s, %s, NOW())", row_count)}
+                        ON CONFLICT (qid) DO UPDATE SET
+                            http_status = EXCLUDED.http_status,
+                            last_seen = NOW()
+                        """,
+                        params,
+                    )
+            conn.commit()
+        return len(payload)
+
+    def sample_entity_revisions(self, qids: Sequence[str]) -> dict[str, int]:
+        if not qids:
+            return {}
+        sql = """
+        SELECT qid, entity_json ->> 'lastrevid'
+        FROM sample_entity_cache
+        WHERE qid IN (SELECT unnest(%s::text[]))
+        """
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (list(qids),), prepare=True)
+                rows = cur.fetchall()
+        revisions: dict[str, int] = {}
+        for qid, raw_revision in rows:
+            if isinstance(qid, str) and isinstance(raw_revision, str) and raw_revision.isdigit():
+                revisions[qid] = int(raw_revision)
+        return revisions
+
     def count_sample_entities(self) -> int:
         with self._connect() as conn:
             with conn.cursor() as cur:
@@ -1507,12 +1854,13 @@ class PostgresStore:
         SELECT qid
         FROM sample_entity_cache
         WHERE qid ~ '^Q[0-9]+$'
+          AND payload_kind = 'full'
         ORDER BY CAST(SUBSTRING(qid FROM 2) AS BIGINT), qid
         LIMIT %s
         """
         with self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (limit,))
+                cur.execute(sql, (limit,), prepare=True)
                 rows = cur.fetchall()
         return [row[0] for row in rows if row and isinstance(row[0], str)]
 
@@ -1653,7 +2001,7 @@ class PostgresStore:
         seed_limit_sql = "" if seed_rows == 0 else " LIMIT %s"
         seed_limit_params: tuple[Any, ...] = () if seed_rows == 0 else (int(seed_rows),)
         create_seed_sql = (
-            f"CREATE TEMP TABLE {temp_seed_ident} AS "
+            f"CREATE TEMP TABLE {temp_seed_ident} ON COMMIT DROP AS "
             "SELECT "
             "    ROW_NUMBER() OVER (ORDER BY seed.qid) AS seed_row_no, "
             "    seed.* "
@@ -1697,9 +2045,11 @@ class PostgresStore:
         with self._connect() as conn:
             with conn.cursor() as cur:
                 if disable_synchronous_commit:
-                    cur.execute("SET SESSION synchronous_commit = OFF")
+                    cur.execute("SET LOCAL synchronous_commit = OFF")
                 cur.execute(f"DROP TABLE IF EXISTS {temp_seed_ident}")
                 cur.execute(create_seed_sql, seed_limit_params)
+                cur.execute(f"CREATE UNIQUE INDEX ON {temp_seed_ident} (seed_row_no)")
+                cur.execute(f"ANALYZE {temp_seed_ident}")
                 cur.execute(
                     f"""
                     SELECT
@@ -1745,6 +2095,7 @@ class PostgresStore:
                             int(random_seed),
                             int(seed_count),
                         ),
+                        prepare=True,
                     )
                     inserted = cur.rowcount if isinstance(cur.rowcount, int) else 0
                     if inserted <= 0:
@@ -1817,36 +2168,30 @@ class PostgresStore:
                 cur.execute(f"ANALYZE {table_ident}")
             conn.commit()
 
-    def table_storage_stats(self, table_name: str) -> dict[str, int]:
-        _quote_identifier(table_name)  # validate
+    def table_storage_stats(self, table_name: str, *, exact: bool = False) -> dict[str, int]:
+        table_ident = _quote_identifier(table_name)
         sql = """
         SELECT
-            (SELECT COUNT(*) FROM %s_placeholder) AS rows,
-            pg_relation_size(%s::regclass) AS table_bytes,
-            pg_indexes_size(%s::regclass) AS index_bytes,
-            pg_total_relation_size(%s::regclass) AS total_bytes,
+            c.reltuples::bigint AS rows,
+            pg_relation_size(c.oid) AS table_bytes,
+            pg_indexes_size(c.oid) AS index_bytes,
+            pg_total_relation_size(c.oid) AS total_bytes,
             GREATEST(
-                pg_total_relation_size(%s::regclass) -
-                pg_relation_size(%s::regclass) -
-                pg_indexes_size(%s::regclass),
+                pg_total_relation_size(c.oid) - pg_relation_size(c.oid) - pg_indexes_size(c.oid),
                 0
             ) AS toast_bytes
+        FROM pg_class AS c
+        WHERE c.oid = %s::regclass
         """
-        sql = sql.replace("%s_placeholder", _quote_identifier(table_name))
         with self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    sql,
-                    (
-                        table_name,
-                        table_name,
-                        table_name,
-                        table_name,
-                        table_name,
-                        table_name,
-                    ),
-                )
+                cur.execute(sql, (table_ident,))
                 row = cur.fetchone()
+                # reltuples is -1 until the table has been vacuumed or analyzed.
+                if row and (exact or not isinstance(row[0], int) or row[0] < 0):
+                    cur.execute(f"SELECT COUNT(*) FROM {table_ident}")
+                    count_row = cur.fetchone()
+                    row = (count_row[0] if count_row else 0, *row[1:])
         if not row or len(row) < 5:
             return {
                 "rows": 0,
@@ -1906,10 +2251,14 @@ class PostgresStore:
 
         with self._connect() as conn:
             with conn.cursor() as cur:
-                for column_name in dropped_columns:
-                    cur.execute(f"ALTER TABLE {table_ident} DROP COLUMN IF EXISTS {_quote_identifier(column_name)}")
-                for index_name in index_drops:
-                    cur.execute(f"DROP INDEX IF EXISTS {_quote_identifier(index_name)}")
+                drop_column_clauses = ", ".join(
+                    f"DROP COLUMN IF EXISTS {_quote_identifier(column_name)}" for column_name in dropped_columns
+                )
+                cur.execute(f"ALTER TABLE {table_ident} {drop_column_clauses}")
+                cur.execute(
+                    "DROP INDEX IF EXISTS "
+                    + ", ".join(_quote_identifier(index_name) for index_name in index_drops)
+                )
                 if drop_context_inputs_table and table_name == "entities":
                     cur.execute("DROP TABLE IF EXISTS entity_context_inputs")
                     cur.execute("DROP TABLE IF EXISTS entity_name_payloads")
@@ -1923,7 +2272,7 @@ class PostgresStore:
 
         if vacuum_full:
             # VACUUM FULL must run outside a transaction; use a fresh autocommit connection.
-            conn = self._connect()
+            conn = self._open_connection()
             try:
                 conn.autocommit = True
                 with conn.cursor() as cur:
@@ -1944,24 +2293,36 @@ class PostgresStore:
     def upsert_sample_entities(
         self,
         rows: Sequence[tuple[str, Mapping[str, Any], str]],
+        *,
+        payload_kind: str = SAMPLE_PAYLOAD_FULL,
     ) -> int:
         if not rows:
             return 0
-        sql = """
-        INSERT INTO sample_entity_cache (qid, entity_json, source_url, updated_at)
-        VALUES (%s, %s::jsonb, %s, NOW())
-        ON CONFLICT (qid) DO UPDATE SET
-            entity_json = EXCLUDED.entity_json,
-            source_url = EXCLUDED.source_url,
-            updated_at = NOW()
-        """
-        payload = [
-            (qid, _json_compact(dict(entity_json)), source_url)
-            for qid, entity_json, source_url in rows
-        ]
+        if payload_kind not in (SAMPLE_PAYLOAD_FULL, SAMPLE_PAYLOAD_LABELS_ONLY):
+            raise ValueError(f"Unsupported sample payload kind: {payload_kind!r}")
+        payload = list(
+            {
+                qid: (qid, _json_compact(dict(entity_json)), source_url, payload_kind)
+                for qid, entity_json, source_url in rows
+            }.values()
+        )
         with self._connect() as conn:
-            with conn.cursor() as cur:
-                cur.executemany(sql, payload)
+            with conn.pipeline(), conn.cursor() as cur:
+                for row_count, params in _iter_value_chunks(payload):
+                    cur.execute(
+                        f"""
+                        INSERT INTO sample_entity_cache (qid, entity_json, source_url, payload_kind, updated_at)
+                        VALUES {_multi_row_values_sql("(%s, %s::jsonb, %s, %s, NOW())", row_count)}
+                        ON CONFLICT (qid) DO UPDATE SET
+                            entity_json = EXCLUDED.entity_json,
+                            source_url = EXCLUDED.source_url,
+                            payload_kind = EXCLUDED.payload_kind,
+                            updated_at = NOW()
+                        WHERE EXCLUDED.payload_kind = 'full'
+                           OR sample_entity_cache.payload_kind <> 'full'
+                        """,
+                        params,
+                    )
             conn.commit()
         return len(payload)
 
@@ -1977,6 +2338,7 @@ class PostgresStore:
                 cur.execute(sql, (ttl_seconds,))
                 deleted = cur.rowcount
             conn.commit()
+        _query_cache_lru_clear(self.dsn)
         return int(deleted) if isinstance(deleted, int) else 0
 
     def clear_entities(self) -> None:
@@ -1998,11 +2360,15 @@ class PostgresStore:
             raise ValueError("batch_size must be > 0")
         total = 0
         buffer: list[EntityRecord] = []
-        for row in rows:
-            buffer.append(row)
-            if len(buffer) >= batch_size:
-                total += self.upsert_entities(buffer)
-                buffer.clear()
-        if buffer:
-            total += self.upsert_entities(buffer)
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                for row in rows:
+                    buffer.append(row)
+                    if len(buffer) >= batch_size:
+                        total += self._stage_and_merge_entities(cur, buffer)
+                        conn.commit()
+                        buffer.clear()
+                if buffer:
+                    total += self._stage_and_merge_entities(cur, buffer)
+                    conn.commit()
         return total
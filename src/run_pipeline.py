@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from collections.abc import Sequence
 
 from .build_postgres_entities import (
     DEFAULT_MAX_ENTITY_TRIPLES,
@@ -35,7 +36,7 @@ def parse_positive_int(raw: str) -> int:
     return value
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description=(
             "Run the deterministic alpaca pipeline: dump -> Postgres entities (pass1) -> "
@@ -138,11 +139,11 @@ def parse_args() -> argparse.Namespace:
             f"(default: {DEFAULT_MAX_ENTITY_TRIPLES_PER_PREDICATE}, 0 keeps all)."
         ),
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
     try:
         postgres_dsn = resolve_postgres_dsn(args.postgres_dsn)
         language_allowlist = parse_language_allowlist(args.languages, arg_name="--languages")
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import re
+import functools
+import string
 from collections.abc import Sequence
 
-_VALID_TYPE_LABEL_RE = re.compile(r"^[A-Za-z0-9_.:/-]+$")
+_TYPE_LABEL_ALLOWED_CHARS = string.ascii_letters + string.digits + "_.:/-"
+_DELETE_TYPE_LABEL_ALLOWED = str.maketrans("", "", _TYPE_LABEL_ALLOWED_CHARS)
+_TYPE_LABELS_CACHE_SIZE = 4096
 
 
 def normalize_type_labels(
@@ -11,16 +14,20 @@ def normalize_type_labels(
     *,
     field_name: str,
 ) -> list[str]:
-    if type_labels is None:
+    if not type_labels:
         return []
+    return list(_normalize_type_labels_cached(tuple(type_labels), field_name))
 
+
+@functools.lru_cache(maxsize=_TYPE_LABELS_CACHE_SIZE)
+def _normalize_type_labels_cached(type_labels: tuple[str, ...], field_name: str) -> tuple[str, ...]:
     normalized: list[str] = []
     seen: set[str] = set()
     for raw in type_labels:
         value = raw.strip()
         if not value:
             continue
-        if not _VALID_TYPE_LABEL_RE.match(value):
+        if value.translate(_DELETE_TYPE_LABEL_ALLOWED):
             raise ValueError(
                 f"Invalid value '{raw}' for {field_name}. Allowed characters: "
                 "letters, digits, '_', '-', '.', ':', '/'."
@@ -29,4 +36,4 @@ def normalize_type_labels(
             seen.add(value)
             normalized.append(value)
 
-    return normalized
+    return tuple(normalized)
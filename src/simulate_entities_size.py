@@ -32,15 +32,15 @@ def parse_non_negative_int(raw: str) -> int:
     return value
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def _format_bytes(num_bytes: int) -> str:
-    value = float(max(0, int(num_bytes)))
-    for unit in ("B", "KB", "MB", "GB", "TB", "PB"):
-        if value < 1024.0 or unit == "PB":
-            if unit == "B":
-                return f"{int(value)} {unit}"
-            return f"{value:.2f} {unit}"
-        value /= 1024.0
-    return f"{int(num_bytes)} B"
+    value = max(0, int(num_bytes))
+    unit_index = min(len(_BYTE_UNITS) - 1, max(0, value.bit_length() - 1) // 10)
+    if unit_index == 0:
+        return f"{value} B"
+    return f"{value / (1 << (10 * unit_index)):.2f} {_BYTE_UNITS[unit_index]}"
 
 
 def _project_linear_storage(current_stats: dict[str, int], *, current_rows: int, target_rows: int) -> dict[str, int]:
@@ -232,7 +232,7 @@ def main() -> int:
             print(f"Running ANALYZE on {args.dest_table}...")
             store.analyze_table(args.dest_table)
 
-        entity_stats = store.table_storage_stats(args.dest_table)
+        entity_stats = store.table_storage_stats(args.dest_table, exact=bool(args.skip_analyze))
         rows = max(1, int(entity_stats["rows"]))
         project_rows = int(args.project_rows)
         projected = _project_linear_storage(
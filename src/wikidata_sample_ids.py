@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import re
+from collections.abc import Iterable
 from pathlib import Path
 
-_QID_RE = re.compile(r"^Q[1-9][0-9]*$")
+_MAX_REPORTED_INVALID_IDS = 10
 
 
 def default_demo_qids(count: int) -> list[str]:
@@ -12,31 +12,38 @@ def default_demo_qids(count: int) -> list[str]:
     return [f"Q{index}" for index in range(1, count + 1)]
 
 
-def parse_qid_list(raw: str) -> list[str]:
-    values = [token.strip().upper() for token in raw.replace("\n", ",").split(",")]
-    ids: list[str] = []
-    seen: set[str] = set()
-    for value in values:
-        if not value:
-            continue
-        if not _QID_RE.match(value):
-            raise ValueError(f"Invalid entity ID '{value}'. Expected QIDs like Q42.")
-        if value in seen:
-            continue
-        seen.add(value)
-        ids.append(value)
+def _is_qid(value: str) -> bool:
+    digits = value[1:]
+    return value[:1] == "Q" and digits[:1] not in ("", "0") and digits.isascii() and digits.isdigit()
+
+
+def _unique_qids(values: Iterable[str]) -> list[str]:
+    # Deduplicate before validating so repeated IDs in large dumps are checked once.
+    ids = list(dict.fromkeys(value for value in values if value))
+    invalid = [value for value in ids if not _is_qid(value)]
+    if len(invalid) == 1:
+        raise ValueError(f"Invalid entity ID '{invalid[0]}'. Expected QIDs like Q42.")
+    if invalid:
+        shown = ", ".join(f"'{value}'" for value in invalid[:_MAX_REPORTED_INVALID_IDS])
+        more = len(invalid) - _MAX_REPORTED_INVALID_IDS
+        suffix = f" and {more} more" if more > 0 else ""
+        raise ValueError(f"Invalid entity IDs {shown}{suffix}. Expected QIDs like Q42.")
     return ids
 
 
+def parse_qid_list(raw: str) -> list[str]:
+    return _unique_qids(token.strip().upper() for token in raw.replace("\n", ",").split(","))
+
+
 def load_qids_from_file(path: Path) -> list[str]:
-    lines = path.read_text(encoding="utf-8").splitlines()
     tokens: list[str] = []
-    for line in lines:
-        cleaned = line.strip()
-        if not cleaned or cleaned.startswith("#"):
-            continue
-        tokens.append(cleaned)
-    return parse_qid_list(",".join(tokens))
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            cleaned = line.strip()
+            if not cleaned or cleaned.startswith("#"):
+                continue
+            tokens.extend(token.strip().upper() for token in cleaned.split(","))
+    return _unique_qids(tokens)
 
 
 def resolve_qids(ids: str | None, ids_file: str | None, count: int | None = None) -> list[str]:
@@ -1,23 +1,32 @@
 from __future__ import annotations
 
 import argparse
-import json
+import gzip
+import http.client
+import queue
+import random
 import sys
+import threading
 import time
-from collections.abc import Mapping, Sequence
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
-from urllib import error, request
+from urllib.parse import quote, urljoin, urlsplit
 
 from .build_bow_docs import extract_claim_object_ids
-from .common import resolve_postgres_dsn, tqdm
-from .postgres_store import PostgresStore
+from .common import json_loads, resolve_postgres_dsn, tqdm
+from .postgres_store import SAMPLE_PAYLOAD_FULL, SAMPLE_PAYLOAD_LABELS_ONLY, PostgresStore
 from .wikidata_sample_ids import resolve_qids
 
 
 DEFAULT_BASE_URL = "https://www.wikidata.org/wiki/Special:EntityData"
+DEFAULT_API_URL = "https://www.wikidata.org/w/api.php"
+DEFAULT_FETCH_BATCH_SIZE = 50
+DEFAULT_SUPPORT_FETCH_PROPS = "info|labels|descriptions"
+DEFAULT_UPSERT_BATCH_ROWS = 200
 DEFAULT_MAX_CONTEXT_OBJECT_IDS = 32
 DEFAULT_SUPPORT_FETCH_CONCURRENCY_CAP = 4
 DEFAULT_SUPPORT_FETCH_MIN_SLEEP_SECONDS = 0.25
@@ -26,7 +35,14 @@ DEFAULT_HTTP_RETRY_BACKOFF_SECONDS = 1.0
 DEFAULT_HTTP_RETRY_MAX_SLEEP_SECONDS = 10.0
 DEFAULT_SUPPORT_PREFETCH_MAX_IN_FLIGHT_FACTOR = 2
 DEFAULT_SUPPORT_RATE_LIMIT_ABORT_THRESHOLD = 25
+DEFAULT_SUPPORT_BREAKER_FAIL_THRESHOLD = 10
+DEFAULT_SUPPORT_BREAKER_WINDOW_SECONDS = 30.0
 DEFAULT_MAX_CONTEXT_SUPPORT_PREFETCH = 256
+DEFAULT_NEGATIVE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+_HTTP_MAX_REDIRECTS = 3
+_HTTP_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_HTTP_CONNECTIONS = threading.local()
+_THROTTLE_STATUSES = frozenset({429, 502, 503, 504})
 
 
 @dataclass(frozen=True, slots=True)
@@ -39,6 +55,52 @@ class FetchResult:
     http_status: int | None = None
 
 
+class _RollingFailureBreaker:
+    __slots__ = ("_fail_threshold", "_window_seconds", "_failures")
+
+    def __init__(self, *, fail_threshold: int, window_seconds: float) -> None:
+        self._fail_threshold = max(1, int(fail_threshold))
+        self._window_seconds = max(0.0, float(window_seconds))
+        self._failures: deque[float] = deque()
+
+    def record_failure(self) -> None:
+        self._failures.append(time.monotonic())
+
+    def is_open(self) -> bool:
+        cutoff = time.monotonic() - self._window_seconds
+        while self._failures and self._failures[0] < cutoff:
+            self._failures.popleft()
+        return len(self._failures) >= self._fail_threshold
+
+
+class _SupportPrefetchThrottle:
+    __slots__ = ("_breaker", "_rate_limit_abort_threshold", "rate_limited_requests")
+
+    def __init__(
+        self,
+        *,
+        rate_limit_abort_threshold: int,
+        fail_threshold: int,
+        window_seconds: float,
+    ) -> None:
+        self._breaker = _RollingFailureBreaker(fail_threshold=fail_threshold, window_seconds=window_seconds)
+        self._rate_limit_abort_threshold = max(1, int(rate_limit_abort_threshold))
+        self.rate_limited_requests = 0
+
+    def record_request(self, results: Sequence[FetchResult]) -> None:
+        # A failed wbgetentities call fans out into one result per QID carrying the request's status,
+        # so throttling and outages are counted once per request, not once per entity.
+        status = next((result.http_status for result in results if result.http_status in _THROTTLE_STATUSES), None)
+        if status is None:
+            return
+        self._breaker.record_failure()
+        if status == 429:
+            self.rate_limited_requests += 1
+
+    def should_abort(self) -> bool:
+        return self.rate_limited_requests >= self._rate_limit_abort_threshold or self._breaker.is_open()
+
+
 def parse_positive_int(raw: str) -> int:
     try:
         value = int(raw)
@@ -74,27 +136,28 @@ def _extract_entity_payload(raw_json: Mapping[str, Any], qid: str) -> dict[str,
     if not isinstance(entities, Mapping):
         return None
     payload = entities.get(qid)
-    if isinstance(payload, Mapping):
-        return {str(k): v for k, v in payload.items() if isinstance(k, str)}
-    return None
+    if not isinstance(payload, Mapping):
+        return None
+    # Decoded JSON objects already have str keys; avoid copying the (often multi-MB) entity.
+    if isinstance(payload, dict) and all(isinstance(key, str) for key in payload):
+        return payload
+    return {str(k): v for k, v in payload.items() if isinstance(k, str)}
 
 
 def _collect_related_entity_ids(
-    payloads: Sequence[Mapping[str, Any]],
+    payloads: Iterable[Mapping[str, Any]],
     *,
     max_context_object_ids: int,
 ) -> list[str]:
     if max_context_object_ids <= 0:
         return []
-    related_ids: list[str] = []
-    seen: set[str] = set()
-    for payload in payloads:
-        for object_id in extract_claim_object_ids(payload, limit=max_context_object_ids):
-            if object_id in seen:
-                continue
-            seen.add(object_id)
-            related_ids.append(object_id)
-    return related_ids
+    return list(
+        dict.fromkeys(
+            object_id
+            for payload in payloads
+            for object_id in extract_claim_object_ids(payload, limit=max_context_object_ids)
+        )
+    )
 
 
 def _deterministic_sample(values: Sequence[str], *, limit: int) -> list[str]:
@@ -104,113 +167,273 @@ def _deterministic_sample(values: Sequence[str], *, limit: int) -> list[str]:
         return list(values)
     n = len(values)
     # Evenly samples across the original deterministic order, preserving order in output.
-    indices = [int(i * n / limit) for i in range(limit)]
-    out: list[str] = []
-    seen: set[int] = set()
-    for idx in indices:
-        if idx in seen:
-            continue
-        seen.add(idx)
-        out.append(values[idx])
-    if len(out) < limit:
-        for idx, value in enumerate(values):
-            if idx in seen:
-                continue
-            out.append(value)
-            if len(out) >= limit:
+    # With n > limit the stride exceeds 1, so the picked indices are already distinct.
+    return [values[(i * n) // limit] for i in range(limit)]
+
+
+def _http_connection(scheme: str, netloc: str, timeout_seconds: float) -> http.client.HTTPConnection:
+    key = (scheme, netloc, float(timeout_seconds))
+    connections = getattr(_HTTP_CONNECTIONS, "by_origin", None)
+    if connections is None:
+        connections = {}
+        _HTTP_CONNECTIONS.by_origin = connections
+    connection = connections.get(key)
+    if connection is None:
+        connection_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        connection = connection_cls(netloc, timeout=timeout_seconds)
+        connections[key] = connection
+    return connection
+
+
+def _drop_http_connection(scheme: str, netloc: str, timeout_seconds: float) -> None:
+    connections = getattr(_HTTP_CONNECTIONS, "by_origin", None)
+    if not connections:
+        return
+    connection = connections.pop((scheme, netloc, float(timeout_seconds)), None)
+    if connection is not None:
+        connection.close()
+
+
+def _http_get(
+    url: str,
+    *,
+    headers: Mapping[str, str],
+    timeout_seconds: float,
+) -> tuple[int, http.client.HTTPMessage, bytes]:
+    # One keep-alive connection per worker thread and origin, so repeated fetches skip the
+    # TCP/TLS handshake that a fresh urlopen() pays on every entity.
+    for _ in range(_HTTP_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        for attempt in range(2):
+            connection = _http_connection(parts.scheme, parts.netloc, timeout_seconds)
+            try:
+                connection.request("GET", target, headers=dict(headers))
+                response = connection.getresponse()
+                body = response.read()
                 break
-    return out
-
-
-def fetch_entity_payload(
-    qid: str,
+            except (http.client.HTTPException, OSError) as exc:
+                _drop_http_connection(parts.scheme, parts.netloc, timeout_seconds)
+                if attempt == 0 and isinstance(exc, (http.client.RemoteDisconnected, ConnectionError)):
+                    continue
+                raise
+        location = response.headers.get("Location")
+        if response.status not in _HTTP_REDIRECT_STATUSES or not location:
+            if response.headers.get("Content-Encoding", "").lower() == "gzip":
+                body = gzip.decompress(body)
+            return int(response.status), response.headers, body
+        url = urljoin(url, location)
+    return int(response.status), response.headers, body
+
+
+def _jittered_backoff_seconds(retry_backoff_seconds: float, attempt: int) -> float:
+    # Equal jitter: keep the exponential floor but spread concurrent workers so a shared
+    # 429/5xx burst does not make every thread retry in lockstep.
+    backoff = max(0.0, float(retry_backoff_seconds)) * (2**attempt)
+    return backoff / 2 + random.uniform(0.0, backoff / 2)
+
+
+def _fetch_json_document(
+    source_url: str,
     *,
-    base_url: str,
     timeout_seconds: float,
-    sleep_seconds: float,
     max_retries: int,
     retry_backoff_seconds: float,
     retry_max_sleep_seconds: float,
-) -> FetchResult:
-    source_url = f"{base_url.rstrip('/')}/{qid}.json"
+) -> tuple[Mapping[str, Any] | None, str | None, int | None]:
     attempts = max(1, int(max_retries) + 1)
     last_http_status: int | None = None
     for attempt in range(attempts):
-        req = request.Request(url=source_url, method="GET")
-        req.add_header("Accept", "application/json")
-        req.add_header("User-Agent", "alpaca-sample-postgres/0.1")
         try:
-            with request.urlopen(req, timeout=timeout_seconds) as resp:
-                body = resp.read()
-        except error.HTTPError as exc:
-            last_http_status = exc.code
-            if exc.code in (429, 502, 503, 504) and attempt + 1 < attempts:
-                retry_after_header = exc.headers.get("Retry-After") if exc.headers else None
+            status, headers, body = _http_get(
+                source_url,
+                headers={
+                    "Accept": "application/json",
+                    "Accept-Encoding": "gzip",
+                    "User-Agent": "alpaca-sample-postgres/0.1",
+                },
+                timeout_seconds=timeout_seconds,
+            )
+        except (http.client.HTTPException, OSError) as exc:
+            if attempt + 1 < attempts:
+                backoff = _jittered_backoff_seconds(retry_backoff_seconds, attempt)
+                if retry_max_sleep_seconds > 0:
+                    backoff = min(backoff, float(retry_max_sleep_seconds))
+                if backoff > 0:
+                    time.sleep(backoff)
+                continue
+            return None, f"Network error: {exc!r}", None
+
+        if status >= 300:
+            last_http_status = status
+            if status in (429, 502, 503, 504) and attempt + 1 < attempts:
+                retry_after_header = headers.get("Retry-After")
                 retry_after_seconds: float | None = None
                 if isinstance(retry_after_header, str):
                     try:
                         retry_after_seconds = float(retry_after_header.strip())
                     except ValueError:
                         retry_after_seconds = None
-                backoff = max(0.0, float(retry_backoff_seconds)) * (2**attempt)
+                backoff = _jittered_backoff_seconds(retry_backoff_seconds, attempt)
                 wait_seconds = retry_after_seconds if retry_after_seconds is not None else backoff
                 if retry_max_sleep_seconds > 0:
                     wait_seconds = min(wait_seconds, float(retry_max_sleep_seconds))
                 if wait_seconds > 0:
                     time.sleep(wait_seconds)
                 continue
-            detail = exc.read().decode("utf-8", errors="replace")[:300]
-            return FetchResult(
-                qid=qid,
-                status="error",
-                source_url=source_url,
-                error=f"HTTP {exc.code}: {detail}",
-                http_status=exc.code,
-            )
-        except error.URLError as exc:
-            reason = exc.reason if isinstance(exc.reason, str) else repr(exc.reason)
-            if attempt + 1 < attempts:
-                backoff = max(0.0, float(retry_backoff_seconds)) * (2**attempt)
-                if retry_max_sleep_seconds > 0:
-                    backoff = min(backoff, float(retry_max_sleep_seconds))
-                if backoff > 0:
-                    time.sleep(backoff)
-                continue
-            return FetchResult(qid=qid, status="error", source_url=source_url, error=f"Network error: {reason}")
+            detail = body.decode("utf-8", errors="replace")[:300]
+            return None, f"HTTP {status}: {detail}", status
 
         try:
-            decoded = json.loads(body.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-            return FetchResult(qid=qid, status="error", source_url=source_url, error=f"Invalid JSON: {exc}")
-
+            # Entity documents run to megabytes; decode straight from bytes.
+            decoded = json_loads(body)
+        except (UnicodeDecodeError, ValueError) as exc:
+            return None, f"Invalid JSON: {exc}", None
         if not isinstance(decoded, Mapping):
-            return FetchResult(
-                qid=qid,
-                status="error",
-                source_url=source_url,
-                error="Top-level JSON is not an object.",
-            )
+            return None, "Top-level JSON is not an object.", None
+        return decoded, None, None
 
+    return (
+        None,
+        f"HTTP {last_http_status}: retry budget exhausted" if last_http_status else "Retry budget exhausted",
+        last_http_status,
+    )
+
+
+def fetch_entity_payload(
+    qid: str,
+    *,
+    base_url: str,
+    timeout_seconds: float,
+    sleep_seconds: float,
+    max_retries: int,
+    retry_backoff_seconds: float,
+    retry_max_sleep_seconds: float,
+) -> FetchResult:
+    source_url = f"{base_url.rstrip('/')}/{qid}.json"
+    decoded, fetch_error, http_status = _fetch_json_document(
+        source_url,
+        timeout_seconds=timeout_seconds,
+        max_retries=max_retries,
+        retry_backoff_seconds=retry_backoff_seconds,
+        retry_max_sleep_seconds=retry_max_sleep_seconds,
+    )
+    if decoded is None:
+        return FetchResult(
+            qid=qid,
+            status="error",
+            source_url=source_url,
+            error=fetch_error,
+            http_status=http_status,
+        )
+
+    payload = _extract_entity_payload(decoded, qid)
+    if payload is None:
+        return FetchResult(
+            qid=qid,
+            status="error",
+            source_url=source_url,
+            error="Entity payload missing in response.",
+        )
+
+    if sleep_seconds > 0:
+        time.sleep(sleep_seconds)
+    return FetchResult(qid=qid, status="fetched", source_url=source_url, payload=payload)
+
+
+def fetch_entity_payloads_batch(
+    qids: Sequence[str],
+    *,
+    api_url: str,
+    timeout_seconds: float,
+    sleep_seconds: float,
+    max_retries: int,
+    retry_backoff_seconds: float,
+    retry_max_sleep_seconds: float,
+    props: str | None = None,
+) -> list[FetchResult]:
+    if not qids:
+        return []
+    api_base = api_url.rstrip("?")
+    props_param = f"&props={quote(props, safe='')}" if props else ""
+    batch_url = f"{api_base}?action=wbgetentities&format=json{props_param}&ids={'%7C'.join(qids)}"
+    decoded, fetch_error, http_status = _fetch_json_document(
+        batch_url,
+        timeout_seconds=timeout_seconds,
+        max_retries=max_retries,
+        retry_backoff_seconds=retry_backoff_seconds,
+        retry_max_sleep_seconds=retry_max_sleep_seconds,
+    )
+    if decoded is not None and isinstance(decoded.get("error"), Mapping):
+        api_error = decoded["error"]
+        fetch_error = f"API error {api_error.get('code', 'unknown')}: {str(api_error.get('info', ''))[:300]}"
+        decoded = None
+
+    results: list[FetchResult] = []
+    for qid in qids:
+        source_url = f"{api_base}?action=wbgetentities&format=json{props_param}&ids={qid}"
+        if decoded is None:
+            results.append(
+                FetchResult(
+                    qid=qid,
+                    status="error",
+                    source_url=source_url,
+                    error=fetch_error,
+                    http_status=http_status,
+                )
+            )
+            continue
         payload = _extract_entity_payload(decoded, qid)
-        if payload is None:
-            return FetchResult(
-                qid=qid,
-                status="error",
-                source_url=source_url,
-                error="Entity payload missing in response.",
+        if payload is None or "missing" in payload:
+            # Mirror Special:EntityData, which answers 404 for unknown or deleted entities.
+            results.append(
+                FetchResult(
+                    qid=qid,
+                    status="error",
+                    source_url=source_url,
+                    error="Entity not found." if payload is not None else "Entity payload missing in response.",
+                    http_status=404 if payload is not None else None,
+                )
             )
+            continue
+        results.append(FetchResult(qid=qid, status="fetched", source_url=source_url, payload=payload))
 
-        if sleep_seconds > 0:
-            time.sleep(sleep_seconds)
-        return FetchResult(qid=qid, status="fetched", source_url=source_url, payload=payload)
+    if sleep_seconds > 0:
+        time.sleep(sleep_seconds)
+    return results
 
-    return FetchResult(
-        qid=qid,
-        status="error",
-        source_url=source_url,
-        error=f"HTTP {last_http_status}: retry budget exhausted" if last_http_status else "Retry budget exhausted",
-        http_status=last_http_status,
-    )
+
+def fetch_entity_revisions_batch(
+    qids: Sequence[str],
+    *,
+    api_url: str,
+    timeout_seconds: float,
+    max_retries: int,
+    retry_backoff_seconds: float,
+    retry_max_sleep_seconds: float,
+) -> dict[str, int]:
+    revisions: dict[str, int] = {}
+    api_base = api_url.rstrip("?")
+    for start in range(0, len(qids), DEFAULT_FETCH_BATCH_SIZE):
+        chunk = qids[start : start + DEFAULT_FETCH_BATCH_SIZE]
+        decoded, _, _ = _fetch_json_document(
+            f"{api_base}?action=wbgetentities&format=json&props=info&ids={'%7C'.join(chunk)}",
+            timeout_seconds=timeout_seconds,
+            max_retries=max_retries,
+            retry_backoff_seconds=retry_backoff_seconds,
+            retry_max_sleep_seconds=retry_max_sleep_seconds,
+        )
+        entities = decoded.get("entities") if decoded is not None else None
+        if not isinstance(entities, Mapping):
+            continue
+        for qid in chunk:
+            entity = entities.get(qid)
+            revision = entity.get("lastrevid") if isinstance(entity, Mapping) else None
+            if isinstance(revision, int):
+                revisions[qid] = revision
+    return revisions
 
 
 def parse_args() -> argparse.Namespace:
@@ -221,6 +444,16 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--postgres-dsn", help="Postgres DSN (defaults to ALPACA_POSTGRES_DSN).")
     parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--api-url", default=DEFAULT_API_URL)
+    parser.add_argument(
+        "--fetch-batch-size",
+        type=parse_positive_int,
+        default=DEFAULT_FETCH_BATCH_SIZE,
+        help=(
+            "QIDs per wbgetentities request (max 50). Use 1 to fetch each entity from "
+            f"Special:EntityData instead (default: {DEFAULT_FETCH_BATCH_SIZE})."
+        ),
+    )
     parser.add_argument("--ids", help="Comma-separated QIDs (example: Q42,Q90,Q64).")
     parser.add_argument("--ids-file", help="Text file with one QID per line (comments with # allowed).")
     parser.add_argument(
@@ -235,6 +468,14 @@ def parse_args() -> argparse.Namespace:
         help="Upper QID probe bound for --count mode (default: 50000).",
     )
     parser.add_argument("--force-refresh", action="store_true", help="Refetch IDs even if already cached in Postgres.")
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help=(
+            "Check cached IDs against their current Wikidata revision (one lightweight props=info "
+            "request per 50 IDs) and refetch only entities that changed."
+        ),
+    )
     parser.add_argument(
         "--max-context-object-ids",
         type=parse_positive_int,
@@ -286,6 +527,28 @@ def main() -> int:
         if not count_mode:
             qids = resolve_qids(args.ids, args.ids_file, None)
 
+        def _cached_qids(candidate_qids: list[str], *, include_labels_only: bool = False) -> set[str]:
+            if args.force_refresh:
+                return set()
+            cached = store.existing_sample_entity_ids(candidate_qids, include_labels_only=include_labels_only)
+            if not args.revalidate or not cached:
+                return cached
+            cached_revisions = store.sample_entity_revisions(sorted(cached))
+            live_revisions = fetch_entity_revisions_batch(
+                sorted(cached_revisions),
+                api_url=args.api_url,
+                timeout_seconds=float(args.timeout_seconds),
+                max_retries=int(args.http_max_retries),
+                retry_backoff_seconds=float(args.http_retry_backoff_seconds),
+                retry_max_sleep_seconds=float(args.http_retry_max_sleep_seconds),
+            )
+            # Unknown revisions on either side count as changed so they are refetched.
+            return {
+                qid
+                for qid, revision in cached_revisions.items()
+                if live_revisions.get(qid) == revision
+            }
+
         fetched_rows: list[tuple[str, Mapping[str, Any], str]] = []
         seed_errors: list[FetchResult] = []
         support_errors: list[FetchResult] = []
@@ -301,11 +564,15 @@ def main() -> int:
         context_support_not_found = 0
         context_support_rate_limited = 0
 
-        def _iter_fetch_many(
+        fetch_batch_size = max(1, min(DEFAULT_FETCH_BATCH_SIZE, int(args.fetch_batch_size)))
+
+        def _iter_fetch_batches(
             missing_qids: list[str],
             *,
             concurrency: int,
             sleep_seconds: float,
+            props: str | None = None,
+            stop_submitting: Callable[[], bool] | None = None,
         ):
             if not missing_qids:
                 return
@@ -316,57 +583,81 @@ def main() -> int:
                 max_workers * DEFAULT_SUPPORT_PREFETCH_MAX_IN_FLIGHT_FACTOR,
             )
 
-            def _submit(executor: ThreadPoolExecutor, qid: str):
+            batch_size = fetch_batch_size
+
+            def _submit(executor: ThreadPoolExecutor, qid_batch: list[str]):
+                fetch_options = {
+                    "timeout_seconds": float(args.timeout_seconds),
+                    "sleep_seconds": float(sleep_seconds),
+                    "max_retries": int(args.http_max_retries),
+                    "retry_backoff_seconds": float(args.http_retry_backoff_seconds),
+                    "retry_max_sleep_seconds": float(args.http_retry_max_sleep_seconds),
+                }
+                if batch_size > 1:
+                    return executor.submit(
+                        fetch_entity_payloads_batch,
+                        qid_batch,
+                        api_url=args.api_url,
+                        props=props,
+                        **fetch_options,
+                    )
                 return executor.submit(
-                    fetch_entity_payload,
-                    qid,
-                    base_url=args.base_url,
-                    timeout_seconds=float(args.timeout_seconds),
-                    sleep_seconds=float(sleep_seconds),
-                    max_retries=int(args.http_max_retries),
-                    retry_backoff_seconds=float(args.http_retry_backoff_seconds),
-                    retry_max_sleep_seconds=float(args.http_retry_max_sleep_seconds),
+                    lambda: [fetch_entity_payload(qid_batch[0], base_url=args.base_url, **fetch_options)]
                 )
 
-            qid_iter = iter(missing_qids)
-            in_flight: set[Any] = set()
-            future_to_qid: dict[Any, str] = {}
+            batch_iter = iter(
+                [missing_qids[start : start + batch_size] for start in range(0, len(missing_qids), batch_size)]
+            )
+            # Completed futures land on a queue via done-callbacks, so each completion costs O(1)
+            # instead of rescanning every in-flight future.
+            completed: queue.SimpleQueue[Any] = queue.SimpleQueue()
+            future_to_qids: dict[Any, list[str]] = {}
             executor = ThreadPoolExecutor(max_workers=max_workers)
-            try:
-                while True:
-                    while len(in_flight) < max_in_flight:
-                        try:
-                            next_qid = next(qid_iter)
-                        except StopIteration:
-                            break
-                        future = _submit(executor, next_qid)
-                        in_flight.add(future)
-                        future_to_qid[future] = next_qid
-
-                    if not in_flight:
-                        break
 
-                    done, pending = wait(in_flight, return_when=FIRST_COMPLETED)
-                    in_flight = set(pending)
-                    for future in done:
-                        qid = future_to_qid.pop(future, "")
-                        try:
-                            yield future.result()
-                        except Exception as exc:
-                            # Defensive guard: convert unexpected worker exceptions into fetch errors.
-                            yield FetchResult(
-                                qid=qid or "UNKNOWN",
+            def _submit_next() -> bool:
+                if stop_submitting is not None and stop_submitting():
+                    return False
+                next_batch = next(batch_iter, None)
+                if next_batch is None:
+                    return False
+                future = _submit(executor, next_batch)
+                future_to_qids[future] = next_batch
+                future.add_done_callback(completed.put)
+                return True
+
+            try:
+                while len(future_to_qids) < max_in_flight and _submit_next():
+                    pass
+                while future_to_qids:
+                    future = completed.get()
+                    qid_batch = future_to_qids.pop(future, [])
+                    try:
+                        results = future.result()
+                    except Exception as exc:
+                        # Defensive guard: convert unexpected worker exceptions into fetch errors.
+                        results = [
+                            FetchResult(
+                                qid=qid,
                                 status="error",
                                 source_url="",
                                 error=f"Unhandled fetch exception: {exc!r}",
                             )
+                            for qid in qid_batch or ["UNKNOWN"]
+                        ]
+                    yield results
+                    # Submit only after the consumer has seen this batch, so stop_submitting reflects it.
+                    _submit_next()
             finally:
-                for future in list(in_flight):
+                for future in list(future_to_qids):
                     future.cancel()
                 executor.shutdown(wait=False, cancel_futures=True)
 
+        def _iter_fetch_many(missing_qids: list[str], **kwargs: Any):
+            for results in _iter_fetch_batches(missing_qids, **kwargs):
+                yield from results
+
         if not count_mode:
-            existing = store.get_sample_entities(qids) if not args.force_refresh else {}
+            existing = _cached_qids(qids)
             to_fetch = [qid for qid in qids if qid not in existing]
             cache_hits = len(existing)
 
@@ -384,6 +675,10 @@ def main() -> int:
                     if result.status == "fetched" and result.payload is not None:
                         fetched_rows.append((result.qid, result.payload, result.source_url))
                         fetched_count += 1
+                        if len(fetched_rows) >= DEFAULT_UPSERT_BATCH_ROWS:
+                            # Flush as we go so large ID lists do not hold every payload in memory.
+                            store.upsert_sample_entities(fetched_rows)
+                            fetched_rows = []
                     else:
                         seed_errors.append(result)
                     progress.set_postfix(cache_hits=cache_hits, fetched=fetched_count, errors=len(seed_errors))
@@ -402,6 +697,9 @@ def main() -> int:
 
             if not args.force_refresh:
                 cached_prefill = store.list_sample_entity_ids(limit=target_count)
+                if cached_prefill and args.revalidate:
+                    unchanged_prefill = _cached_qids(cached_prefill)
+                    cached_prefill = [qid for qid in cached_prefill if qid in unchanged_prefill]
                 if cached_prefill:
                     selected_qids.extend(cached_prefill)
                     selected_seen.update(cached_prefill)
@@ -418,16 +716,30 @@ def main() -> int:
                         skipped=seed_transient_skipped,
                         errors=len(seed_errors),
                     )
+                # Plain cache probes only need membership, so load the whole probe range in one query.
+                preloaded_cached: set[str] | None = None
+                if not args.force_refresh and not args.revalidate:
+                    preloaded_cached = store.sample_entity_ids_in_range(1, max_probe_id)
+                # QIDs that were 404 on a recent run are skipped instead of probed again.
+                known_missing: set[str] = set()
+                if not args.force_refresh:
+                    known_missing = store.negative_sample_entity_ids_in_range(
+                        1,
+                        max_probe_id,
+                        max_age_seconds=DEFAULT_NEGATIVE_CACHE_TTL_SECONDS,
+                    )
+                chunk_size = max(16, args.concurrency * 4)
                 while len(selected_qids) < target_count and probe_cursor <= max_probe_id:
-                    chunk_size = max(16, args.concurrency * 4)
-                    candidate_qids = [f"Q{value}" for value in range(probe_cursor, probe_cursor + chunk_size)]
+                    probe_end = min(probe_cursor + chunk_size, max_probe_id + 1)
+                    candidate_qids = [f"Q{value}" for value in range(probe_cursor, probe_end)]
                     probe_cursor += chunk_size
-                    candidate_qids = [qid for qid in candidate_qids if int(qid[1:]) <= max_probe_id]
                     if not candidate_qids:
                         break
 
                     existing_batch = (
-                        {} if args.force_refresh else store.get_sample_entities(candidate_qids)
+                        preloaded_cached.intersection(candidate_qids)
+                        if preloaded_cached is not None
+                        else _cached_qids(candidate_qids)
                     )
                     for qid in candidate_qids:
                         if qid in existing_batch and qid not in selected_seen and len(selected_qids) < target_count:
@@ -435,7 +747,9 @@ def main() -> int:
                             selected_qids.append(qid)
                             cache_hits += 1
                             progress.update(1)
-                    missing_batch = [qid for qid in candidate_qids if qid not in existing_batch]
+                    missing_batch = [
+                        qid for qid in candidate_qids if qid not in existing_batch and qid not in known_missing
+                    ]
 
                     if len(selected_qids) >= target_count:
                         progress.set_postfix(
@@ -449,6 +763,7 @@ def main() -> int:
                         break
 
                     batch_rows: list[tuple[str, Mapping[str, Any], str]] = []
+                    not_found_rows: list[tuple[str, int]] = []
                     for result in _iter_fetch_many(
                         missing_batch,
                         concurrency=int(args.concurrency),
@@ -463,6 +778,7 @@ def main() -> int:
                                 progress.update(1)
                         elif result.http_status == 404:
                             nonfatal_not_found += 1
+                            not_found_rows.append((result.qid, 404))
                         elif result.http_status in (429, 502, 503, 504):
                             seed_rate_limited += 1
                             # Count mode is best-effort by design: skip transiently failing IDs and continue probing.
@@ -480,6 +796,8 @@ def main() -> int:
 
                     if batch_rows:
                         store.upsert_sample_entities(batch_rows)
+                    if not_found_rows:
+                        store.record_negative_sample_entities(not_found_rows)
 
                 if len(selected_qids) < target_count:
                     raise ValueError(
@@ -498,7 +816,7 @@ def main() -> int:
             )
 
         support_candidates = _collect_related_entity_ids(
-            list(seed_payloads.values()),
+            seed_payloads.values(),
             max_context_object_ids=int(args.max_context_object_ids),
         )
         seed_qid_set = set(seed_qids)
@@ -512,11 +830,15 @@ def main() -> int:
         context_support_sampled = len(support_qids)
 
         if support_qids:
-            existing_support = {} if args.force_refresh else store.get_sample_entities(support_qids)
+            existing_support = _cached_qids(support_qids, include_labels_only=True)
             support_to_fetch = [qid for qid in support_qids if qid not in existing_support]
             context_support_cache_hits = len(existing_support)
             support_concurrency = max(1, min(int(args.concurrency), DEFAULT_SUPPORT_FETCH_CONCURRENCY_CAP))
             support_sleep_seconds = max(float(args.sleep_seconds), DEFAULT_SUPPORT_FETCH_MIN_SLEEP_SECONDS)
+            # Support entities only feed context labels, so the batch API can skip claims/sitelinks/aliases.
+            # The per-entity EntityData path (--fetch-batch-size 1) always returns full documents.
+            support_props = DEFAULT_SUPPORT_FETCH_PROPS if fetch_batch_size > 1 else None
+            support_payload_kind = SAMPLE_PAYLOAD_LABELS_ONLY if support_props else SAMPLE_PAYLOAD_FULL
 
             with tqdm(total=len(support_qids), desc="sample-context", unit="entity") as progress:
                 if context_support_cache_hits:
@@ -531,21 +853,35 @@ def main() -> int:
 
                 batch_rows: list[tuple[str, Mapping[str, Any], str]] = []
                 support_prefetch_aborted = False
-                for result in _iter_fetch_many(
+                # Trip on a burst of upstream throttling/outage responses, not only on the cumulative total,
+                # so no further batches are submitted and in-flight ones are cancelled.
+                support_throttle = _SupportPrefetchThrottle(
+                    rate_limit_abort_threshold=DEFAULT_SUPPORT_RATE_LIMIT_ABORT_THRESHOLD,
+                    fail_threshold=DEFAULT_SUPPORT_BREAKER_FAIL_THRESHOLD,
+                    window_seconds=DEFAULT_SUPPORT_BREAKER_WINDOW_SECONDS,
+                )
+                for results in _iter_fetch_batches(
                     support_to_fetch,
                     concurrency=support_concurrency,
                     sleep_seconds=support_sleep_seconds,
+                    props=support_props,
+                    stop_submitting=support_throttle.should_abort,
                 ):
-                    progress.update(1)
-                    if result.status == "fetched" and result.payload is not None:
-                        batch_rows.append((result.qid, result.payload, result.source_url))
-                        context_support_fetched += 1
-                    elif result.http_status == 404:
-                        context_support_not_found += 1
-                    elif result.http_status == 429:
-                        context_support_rate_limited += 1
-                    else:
-                        support_errors.append(result)
+                    support_throttle.record_request(results)
+                    for result in results:
+                        progress.update(1)
+                        if result.status == "fetched" and result.payload is not None:
+                            batch_rows.append((result.qid, result.payload, result.source_url))
+                            context_support_fetched += 1
+                            if len(batch_rows) >= DEFAULT_UPSERT_BATCH_ROWS:
+                                store.upsert_sample_entities(batch_rows, payload_kind=support_payload_kind)
+                                batch_rows = []
+                        elif result.http_status == 404:
+                            context_support_not_found += 1
+                        elif result.http_status == 429:
+                            context_support_rate_limited += 1
+                        else:
+                            support_errors.append(result)
                     progress.set_postfix(
                         cache_hits=context_support_cache_hits,
                         fetched=context_support_fetched,
@@ -553,14 +889,14 @@ def main() -> int:
                         rate_limited=context_support_rate_limited,
                         errors=len(support_errors),
                     )
-                    if context_support_rate_limited >= DEFAULT_SUPPORT_RATE_LIMIT_ABORT_THRESHOLD:
+                    if support_throttle.should_abort():
                         support_prefetch_aborted = True
                         break
                 if batch_rows:
-                    store.upsert_sample_entities(batch_rows)
+                    store.upsert_sample_entities(batch_rows, payload_kind=support_payload_kind)
                 if support_prefetch_aborted:
                     print(
-                        "WARNING: Aborting remaining context-support prefetch after repeated HTTP 429 rate limits. "
+                        "WARNING: Aborting remaining context-support prefetch after repeated HTTP 429/5xx responses. "
                         "Continuing with partial support cache for live demo responsiveness.",
                         file=sys.stderr,
                     )
@@ -9,23 +9,36 @@ from pathlib import Path
 from src.build_small_dump import _build_from_count, _build_from_ids, parse_entity_id_list
 
 
-def write_source_dump(path: Path) -> None:
-    entities = [
-        {"id": "L1", "labels": {"en": {"value": "lexeme"}}},
-        {"id": "Q1", "labels": {"en": {"value": "Universe"}}},
-        {"id": "P31", "labels": {"en": {"value": "instance of"}}},
-        {"id": "Q42", "labels": {"en": {"value": "Douglas Adams"}}},
-    ]
+_SOURCE_ENTITIES = [
+    {"id": "L1", "labels": {"en": {"value": "lexeme"}}},
+    {"id": "Q1", "labels": {"en": {"value": "Universe"}}},
+    {"id": "P31", "labels": {"en": {"value": "instance of"}}},
+    {"id": "Q42", "labels": {"en": {"value": "Douglas Adams"}}},
+]
+_SOURCE_DUMP_JSON = (
+    "[\n"
+    + ",\n".join(json.dumps(entity, ensure_ascii=False) for entity in _SOURCE_ENTITIES)
+    + "\n]\n"
+).encode("utf-8")
+_SOURCE_DUMP_BZ2 = bz2.compress(_SOURCE_DUMP_JSON)
+
 
-    with bz2.open(path, mode="wt", encoding="utf-8") as handle:
-        handle.write("[\n")
-        for index, entity in enumerate(entities):
-            suffix = "," if index < len(entities) - 1 else ""
-            handle.write(f"{json.dumps(entity, ensure_ascii=False)}{suffix}\n")
-        handle.write("]\n")
+def write_source_dump(path: Path) -> None:
+    # Only the .bz2 smoke test pays for compressed input; other tests read plain JSON.
+    path.write_bytes(_SOURCE_DUMP_BZ2 if path.suffix == ".bz2" else _SOURCE_DUMP_JSON)
 
 
 class BuildSmallDumpTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp_dir.cleanup)
+        cls.root = Path(tmp_dir.name)
+        cls.source_bz2 = cls.root / "source.json.bz2"
+        cls.source_json = cls.root / "source.json"
+        write_source_dump(cls.source_bz2)
+        write_source_dump(cls.source_json)
+
     def test_parse_entity_id_list_accepts_q_and_p(self) -> None:
         self.assertEqual(parse_entity_id_list("Q42,P31,Q42"), ["Q42", "P31"])
 
@@ -34,35 +47,27 @@ class BuildSmallDumpTests(unittest.TestCase):
             parse_entity_id_list("Q42,L1")
 
     def test_build_from_count_streams_supported_entities(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            root = Path(tmp_dir)
-            source = root / "source.json.bz2"
-            output = root / "small.json.bz2"
-            write_source_dump(source)
+        with tempfile.TemporaryDirectory(dir=self.root) as tmp_dir:
+            output = Path(tmp_dir) / "small.json.bz2"
 
-            written, scanned = _build_from_count(source, output, count=2)
+            written, scanned = _build_from_count(self.source_bz2, output, count=2)
             self.assertEqual(written, 2)
             self.assertGreaterEqual(scanned, 3)
 
-            with bz2.open(output, mode="rt", encoding="utf-8") as handle:
-                payload = json.loads(handle.read())
+            payload = json.loads(bz2.decompress(output.read_bytes()))
 
             self.assertEqual([item["id"] for item in payload], ["Q1", "P31"])
 
     def test_build_from_ids_preserves_requested_order(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            root = Path(tmp_dir)
-            source = root / "source.json.bz2"
-            output = root / "small_ids.json.bz2"
-            write_source_dump(source)
+        with tempfile.TemporaryDirectory(dir=self.root) as tmp_dir:
+            output = Path(tmp_dir) / "small_ids.json"
 
-            written, missing, scanned = _build_from_ids(source, output, ["Q42", "P31", "Q999999"])
+            written, missing, scanned = _build_from_ids(self.source_json, output, ["Q42", "P31", "Q999999"])
             self.assertEqual(written, 2)
             self.assertEqual(missing, 1)
             self.assertGreater(scanned, 0)
 
-            with bz2.open(output, mode="rt", encoding="utf-8") as handle:
-                payload = json.loads(handle.read())
+            payload = json.loads(output.read_text(encoding="utf-8"))
 
             self.assertEqual([item["id"] for item in payload], ["Q42", "P31"])
 
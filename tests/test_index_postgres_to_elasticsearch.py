@@ -3,7 +3,13 @@ from __future__ import annotations
 import unittest
 from datetime import datetime, timezone
 
-from src.index_postgres_to_elasticsearch import _build_index_payload, _row_to_document
+from src.index_postgres_to_elasticsearch import (
+    _autotune_bulk_actions,
+    _build_index_payload,
+    _iter_bulk_payloads,
+    _row_to_document,
+    _split_bulk_payload,
+)
 
 
 class IndexPostgresToElasticsearchTests(unittest.TestCase):
@@ -57,6 +63,37 @@ class IndexPostgresToElasticsearchTests(unittest.TestCase):
         )
         self.assertNotIn("search_text", properties)
 
+    def test_autotune_bulk_actions_targets_bytes_from_p95_doc_size(self) -> None:
+        docs = [{"qid": f"Q{index}", "label": "x" * 900} for index in range(200)]
+        p95_doc_bytes = len('{"qid":"Q100","label":""}') + 900
+
+        self.assertEqual(
+            _autotune_bulk_actions(docs, target_bytes=1_000_000),
+            1_000_000 // (p95_doc_bytes + 64),
+        )
+        self.assertEqual(_autotune_bulk_actions(docs, target_bytes=1_000), 100)
+        self.assertIsNone(_autotune_bulk_actions([], target_bytes=1_000_000))
+
+    def test_iter_bulk_payloads_flushes_on_byte_budget_and_splits_in_half(self) -> None:
+        docs = [{"qid": f"Q{index}", "label": "x" * 100} for index in range(10)]
+        docs.append({"label": "missing qid"})
+
+        payloads = list(_iter_bulk_payloads("entities", docs, max_actions=4, max_bytes=450))
+
+        self.assertEqual([count for _, count in payloads], [2, 2, 2, 2, 2])
+        self.assertTrue(all(payload.endswith(b"\n") for payload, _ in payloads))
+        self.assertEqual(
+            [count for _, count in _iter_bulk_payloads("entities", docs, max_actions=4, max_bytes=10_000_000)],
+            [4, 4, 2],
+        )
+
+        payload, _ = next(_iter_bulk_payloads("entities", docs, max_actions=3, max_bytes=10_000_000))
+        halves = _split_bulk_payload(payload)
+        assert halves is not None
+        self.assertEqual([count for _, count in halves], [1, 2])
+        self.assertEqual(halves[0][0] + halves[1][0], payload)
+        self.assertIsNone(_split_bulk_payload(halves[0][0]))
+
 
 if __name__ == "__main__":
     unittest.main()
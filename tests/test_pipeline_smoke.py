@@ -9,6 +9,7 @@ import unittest
 from pathlib import Path
 
 from src.build_bow_docs import run as run_bow_docs
+from src.build_labels_db import load_labels_json, open_labels_db
 from src.build_labels_db import run as run_labels_db
 
 
@@ -81,79 +82,73 @@ def write_tiny_ner_types(path: Path) -> None:
 
 
 class PipelineSmokeTests(unittest.TestCase):
-    def test_build_labels_db_from_tiny_dump(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            root = Path(tmp_dir)
-            dump_path = root / "tiny.json.bz2"
-            db_path = root / "labels.sqlite"
-            write_tiny_dump(dump_path)
+    @classmethod
+    def setUpClass(cls) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp_dir.cleanup)
+        cls.root = Path(tmp_dir.name)
+        cls.dump_path = cls.root / "tiny.json.bz2"
+        write_tiny_dump(cls.dump_path)
+        cls.labels_db_path = cls.root / "labels.sqlite"
+        cls.labels_exit = run_labels_db(
+            dump_path=cls.dump_path,
+            db_path=cls.labels_db_path,
+            batch_size=2,
+            limit=0,
+            disable_ner_classifier=False,
+        )
 
-            exit_code = run_labels_db(
-                dump_path=dump_path,
-                db_path=db_path,
-                batch_size=2,
-                limit=0,
-                disable_ner_classifier=False,
-            )
-            self.assertEqual(exit_code, 0)
-
-            conn = sqlite3.connect(db_path)
-            try:
-                row_count = conn.execute("SELECT COUNT(*) FROM labels").fetchone()
-                assert row_count is not None
-                self.assertEqual(row_count[0], 2)
-
-                ids = conn.execute("SELECT id FROM labels ORDER BY id").fetchall()
-                self.assertEqual([row[0] for row in ids], ["P31", "Q1"])
-
-                p31_payload_raw = conn.execute(
-                    "SELECT labels_json FROM labels WHERE id = ?",
-                    ("P31",),
-                ).fetchone()
-                assert p31_payload_raw is not None
-                p31_payload = json.loads(p31_payload_raw[0])
-                self.assertEqual(p31_payload["coarse_type"], "RELATION")
-                self.assertEqual(p31_payload["fine_type"], "PROPERTY")
-                self.assertNotIn("ner_coarse_types", p31_payload)
-                self.assertNotIn("ner_fine_types", p31_payload)
-
-                q1_payload_raw = conn.execute(
-                    "SELECT labels_json FROM labels WHERE id = ?",
-                    ("Q1",),
-                ).fetchone()
-                assert q1_payload_raw is not None
-                q1_payload = json.loads(q1_payload_raw[0])
-                self.assertIn("coarse_type", q1_payload)
-                self.assertIn("fine_type", q1_payload)
-                self.assertNotIn("ner_coarse_types", q1_payload)
-                self.assertNotIn("ner_fine_types", q1_payload)
-                self.assertTrue(len(q1_payload["coarse_type"]) >= 1)
-                self.assertTrue(len(q1_payload["fine_type"]) >= 1)
-            finally:
-                conn.close()
+    def test_build_labels_db_from_tiny_dump(self) -> None:
+        self.assertEqual(self.labels_exit, 0)
+
+        conn = open_labels_db(self.labels_db_path)
+        try:
+            row_count = conn.execute("SELECT COUNT(*) FROM labels").fetchone()
+            assert row_count is not None
+            self.assertEqual(row_count[0], 2)
+
+            ids = conn.execute("SELECT id FROM labels ORDER BY id").fetchall()
+            self.assertEqual([row[0] for row in ids], ["P31", "Q1"])
+
+            p31_payload_raw = conn.execute(
+                "SELECT labels_json FROM labels WHERE id = ?",
+                ("P31",),
+            ).fetchone()
+            assert p31_payload_raw is not None
+            self.assertIsInstance(p31_payload_raw[0], bytes)
+            p31_payload = load_labels_json(p31_payload_raw[0])
+            self.assertEqual(load_labels_json(json.dumps(p31_payload)), p31_payload)
+            self.assertEqual(p31_payload["coarse_type"], "RELATION")
+            self.assertEqual(p31_payload["fine_type"], "PROPERTY")
+            self.assertNotIn("ner_coarse_types", p31_payload)
+            self.assertNotIn("ner_fine_types", p31_payload)
+
+            q1_payload_raw = conn.execute(
+                "SELECT labels_json FROM labels WHERE id = ?",
+                ("Q1",),
+            ).fetchone()
+            assert q1_payload_raw is not None
+            q1_payload = load_labels_json(q1_payload_raw[0])
+            self.assertIn("coarse_type", q1_payload)
+            self.assertIn("fine_type", q1_payload)
+            self.assertNotIn("ner_coarse_types", q1_payload)
+            self.assertNotIn("ner_fine_types", q1_payload)
+            self.assertTrue(len(q1_payload["coarse_type"]) >= 1)
+            self.assertTrue(len(q1_payload["fine_type"]) >= 1)
+        finally:
+            conn.close()
 
     def test_build_bow_docs_from_tiny_dump_with_ner_types(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory(dir=self.root) as tmp_dir:
             root = Path(tmp_dir)
-            dump_path = root / "tiny.json.bz2"
-            db_path = root / "labels.sqlite"
             output_path = root / "bow_docs.jsonl.gz"
             ner_types_path = root / "ner_types.jsonl"
-            write_tiny_dump(dump_path)
             write_tiny_ner_types(ner_types_path)
-
-            labels_exit = run_labels_db(
-                dump_path=dump_path,
-                db_path=db_path,
-                batch_size=2,
-                limit=0,
-                disable_ner_classifier=False,
-            )
-            self.assertEqual(labels_exit, 0)
+            self.assertEqual(self.labels_exit, 0)
 
             bow_exit = run_bow_docs(
-                dump_path=dump_path,
-                labels_db_path=db_path,
+                dump_path=self.dump_path,
+                labels_db_path=self.labels_db_path,
                 output_path=output_path,
                 batch_size=2,
                 limit=0,
@@ -184,11 +179,10 @@ class PipelineSmokeTests(unittest.TestCase):
             self.assertNotIn("ner_fine_types", docs_by_id["P31"])
 
     def test_limit_enables_fast_smoke_runs(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory(dir=self.root) as tmp_dir:
             root = Path(tmp_dir)
-            dump_path = root / "tiny.json.bz2"
+            dump_path = self.dump_path
             db_path = root / "labels.sqlite"
-            write_tiny_dump(dump_path)
 
             exit_code = run_labels_db(
                 dump_path=dump_path,
@@ -207,6 +201,31 @@ class PipelineSmokeTests(unittest.TestCase):
             finally:
                 conn.close()
 
+    def test_build_labels_db_worker_processes_match_in_process_rows(self) -> None:
+        self.assertEqual(self.labels_exit, 0)
+        with tempfile.TemporaryDirectory(dir=self.root) as tmp_dir:
+            db_path = Path(tmp_dir) / "labels_workers.sqlite"
+            exit_code = run_labels_db(
+                dump_path=self.dump_path,
+                db_path=db_path,
+                batch_size=2,
+                limit=0,
+                disable_ner_classifier=False,
+                workers=2,
+            )
+            self.assertEqual(exit_code, 0)
+
+            rows_by_db: list[list[tuple[str, str]]] = []
+            for path in (self.labels_db_path, db_path):
+                conn = sqlite3.connect(path)
+                try:
+                    rows_by_db.append(conn.execute("SELECT id, labels_json FROM labels ORDER BY id").fetchall())
+                finally:
+                    conn.close()
+
+            self.assertEqual(len(rows_by_db[0]), 2)
+            self.assertEqual(rows_by_db[1], rows_by_db[0])
+
 
 if __name__ == "__main__":
     unittest.main()
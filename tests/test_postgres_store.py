@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import contextlib
 import unittest
+from unittest import mock
 
 from src.postgres_store import (
+    _QUERY_CACHE_LRU_TTL_SECONDS,
+    PostgresStoreError,
     _entity_triples_index_create_statements,
     _entity_triples_index_drop_statements,
     _entity_search_columns,
     _expand_dbpedia_ref,
     _expand_wikipedia_ref,
+    _fuzzy_candidates_sql,
+    _iter_value_chunks,
+    _lookup_payloads_to_candidates,
+    _multi_row_values_sql,
+    _pooled_connection,
+    _query_cache_lru_clear,
+    _query_cache_lru_get,
+    _query_cache_lru_put,
     compact_crosslink_hint,
 )
 
@@ -62,6 +74,118 @@ class PostgresStoreHelpersTests(unittest.TestCase):
             ],
         )
 
+    def test_compact_cross_refs_ignore_query_and_fragment(self) -> None:
+        self.assertEqual(
+            compact_crosslink_hint("https://de.wikipedia.org/wiki/Berlin?action=view#History"),
+            "de.wikipedia.org|Berlin",
+        )
+        self.assertEqual(
+            compact_crosslink_hint("http://it.dbpedia.org/resource/Roma?x=1"),
+            "it.dbpedia.org|Roma",
+        )
+
+    def test_iter_value_chunks_flattens_params_per_multi_row_statement(self) -> None:
+        payload = [("Q1", "P31", "Q5"), ("Q2", "P31", "Q5"), ("Q3", "P17", "Q38")]
+
+        chunks = list(_iter_value_chunks(payload, chunk_size=2))
+
+        self.assertEqual(
+            chunks,
+            [
+                (2, ["Q1", "P31", "Q5", "Q2", "P31", "Q5"]),
+                (1, ["Q3", "P17", "Q38"]),
+            ],
+        )
+        self.assertEqual(_multi_row_values_sql("(%s, %s)", 2), "(%s, %s), (%s, %s)")
+
+    def test_fuzzy_candidates_sql_is_stable_per_hint_combination(self) -> None:
+        with_hints = _fuzzy_candidates_sql(True, True, False)
+
+        self.assertIs(with_hints, _fuzzy_candidates_sql(True, True, False))
+        self.assertIn("coarse_type = ANY(%s)", with_hints)
+        self.assertNotIn("fine_type = ANY(%s)", with_hints)
+        self.assertIn("OR dbpedia_url = ANY(q.crosslinks))", _fuzzy_candidates_sql(True, False, False))
+        self.assertEqual(_fuzzy_candidates_sql(False, False, True).count("%s"), 5)
+
+    def test_lookup_payloads_to_candidates_expands_cross_refs(self) -> None:
+        candidates = _lookup_payloads_to_candidates(
+            [
+                {
+                    "qid": "Q220",
+                    "label": "Rome",
+                    "popularity": 10,
+                    "prior": 0.5,
+                    "score": 4,
+                    "wikipedia_url": "it.wikipedia.org|Roma",
+                    "dbpedia_url": "",
+                },
+                None,
+            ]
+        )
+
+        self.assertEqual(len(candidates), 1)
+        self.assertEqual(candidates[0]["cross_refs"], {"wikipedia": "https://it.wikipedia.org/wiki/Roma"})
+        self.assertEqual(candidates[0]["score"], 4.0)
+        self.assertEqual(candidates[0]["context_string"], "")
+        self.assertNotIn("wikipedia_url", candidates[0])
+
+    def test_query_cache_lru_returns_copies_and_clears_per_dsn(self) -> None:
+        _query_cache_lru_put("dsn-a", "key", {"returned": 1})
+        _query_cache_lru_put("dsn-b", "key", {"returned": 2})
+
+        cached = _query_cache_lru_get("dsn-a", "key")
+        self.assertEqual(cached, {"returned": 1})
+        cached["cache_hit"] = True
+        self.assertEqual(_query_cache_lru_get("dsn-a", "key"), {"returned": 1})
+
+        _query_cache_lru_put("dsn-a", "nested", {"top_k": [{"qid": "Q1", "score": 1.0}]})
+        _query_cache_lru_get("dsn-a", "nested")["top_k"][0]["score"] = 0.0
+        self.assertEqual(_query_cache_lru_get("dsn-a", "nested"), {"top_k": [{"qid": "Q1", "score": 1.0}]})
+
+        _query_cache_lru_clear("dsn-a")
+        self.assertIsNone(_query_cache_lru_get("dsn-a", "key"))
+        self.assertEqual(_query_cache_lru_get("dsn-b", "key"), {"returned": 2})
+        _query_cache_lru_clear("dsn-b")
+
+    def test_query_cache_lru_entries_expire_after_ttl(self) -> None:
+        with mock.patch("src.postgres_store.time.monotonic", return_value=1000.0):
+            _query_cache_lru_put("dsn-ttl", "key", {"returned": 1})
+            self.assertEqual(_query_cache_lru_get("dsn-ttl", "key"), {"returned": 1})
+        with mock.patch(
+            "src.postgres_store.time.monotonic",
+            return_value=1000.0 + _QUERY_CACHE_LRU_TTL_SECONDS,
+        ):
+            self.assertIsNone(_query_cache_lru_get("dsn-ttl", "key"))
+
+    def test_pooled_connection_wraps_checkout_errors_only(self) -> None:
+        class _Pool:
+            def __init__(self, *, fail_checkout: bool) -> None:
+                self.fail_checkout = fail_checkout
+                self.exit_exc_types: list[type[BaseException] | None] = []
+
+            @contextlib.contextmanager
+            def connection(self):
+                if self.fail_checkout:
+                    raise TimeoutError("pool exhausted")
+                try:
+                    yield "conn"
+                except BaseException as exc:
+                    self.exit_exc_types.append(type(exc))
+                    raise
+                self.exit_exc_types.append(None)
+
+        with self.assertRaisesRegex(PostgresStoreError, "pool exhausted"):
+            with _pooled_connection(_Pool(fail_checkout=True)):
+                pass
+
+        pool = _Pool(fail_checkout=False)
+        with _pooled_connection(pool) as conn:
+            self.assertEqual(conn, "conn")
+        with self.assertRaises(KeyError):
+            with _pooled_connection(pool):
+                raise KeyError("query failed")
+        self.assertEqual(pool.exit_exc_types, [None, KeyError])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import sys
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -37,7 +36,6 @@ class _StubStore:
 class RunPipelineCliTests(unittest.TestCase):
     def test_main_passes_live_expected_total_to_pass1(self) -> None:
         argv = [
-            "run_pipeline",
             "--dump-path",
             "/tmp/latest-all.json.bz2",
             "--postgres-dsn",
@@ -46,12 +44,11 @@ class RunPipelineCliTests(unittest.TestCase):
         ]
 
         with (
-            patch.object(sys, "argv", argv),
             patch("src.run_pipeline.resolve_expected_entity_total", return_value=120_830_824) as resolve_mock,
             patch("src.run_pipeline.run_postgres_pass1", return_value=0) as pass1_mock,
             patch("src.run_pipeline.PostgresStore", _StubStore),
         ):
-            exit_code = run_pipeline.main()
+            exit_code = run_pipeline.main(argv)
 
         self.assertEqual(exit_code, 0)
         resolve_mock.assert_called_once()
@@ -16,6 +16,12 @@ class SearchLogicTests(unittest.TestCase):
     def test_normalize_type_labels_rejects_invalid_values(self) -> None:
         with self.assertRaises(ValueError):
             normalize_type_labels(["PERSON", "ORG)"], field_name="coarse_type")
+        with self.assertRaises(ValueError):
+            normalize_type_labels(["Persón"], field_name="coarse_type")
+        self.assertEqual(
+            normalize_type_labels(["wd:Q5", "schema.org/Person"], field_name="fine_type"),
+            ["wd:Q5", "schema.org/Person"],
+        )
 
     def test_normalize_type_labels_none_returns_empty(self) -> None:
         self.assertEqual(normalize_type_labels(None, field_name="fine_type"), [])
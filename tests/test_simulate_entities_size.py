@@ -3,7 +3,7 @@ from __future__ import annotations
 import unittest
 
 from src.postgres_store import sampled_seed_row_number
-from src.simulate_entities_size import project_entity_triple_stats
+from src.simulate_entities_size import _format_bytes, project_entity_triple_stats
 
 
 class SimulateEntitiesSizeTests(unittest.TestCase):
@@ -13,6 +13,13 @@ class SimulateEntitiesSizeTests(unittest.TestCase):
 
         self.assertEqual(first, second)
 
+    def test_format_bytes_picks_unit_from_magnitude(self) -> None:
+        self.assertEqual(_format_bytes(-1), "0 B")
+        self.assertEqual(_format_bytes(1023), "1023 B")
+        self.assertEqual(_format_bytes(1024), "1.00 KB")
+        self.assertEqual(_format_bytes(3 * 1024**3 // 2), "1.50 GB")
+        self.assertEqual(_format_bytes(2048 * 1024**5), "2048.00 PB")
+
     def test_sampled_seed_row_number_changes_when_seed_changes(self) -> None:
         first = [sampled_seed_row_number(sample_no=index, seed_count=5, random_seed=1337) for index in range(8)]
         second = [sampled_seed_row_number(sample_no=index, seed_count=5, random_seed=1338) for index in range(8)]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import unittest
 
-from src.wikidata_sample_ids import default_demo_qids, resolve_qids
+from src.wikidata_sample_ids import default_demo_qids, parse_qid_list, resolve_qids
 
 
 class WikidataSampleIdsTests(unittest.TestCase):
@@ -12,6 +12,14 @@ class WikidataSampleIdsTests(unittest.TestCase):
     def test_resolve_qids_supports_count(self) -> None:
         self.assertEqual(resolve_qids(None, None, 2), ["Q1", "Q2"])
 
+    def test_parse_qid_list_dedupes_and_rejects_malformed_ids(self) -> None:
+        self.assertEqual(parse_qid_list("q42, Q1\nQ42,,Q10"), ["Q42", "Q1", "Q10"])
+        for invalid in ("Q0", "Q01", "Q", "P31", "Q1a", "Q\u00b2"):
+            with self.assertRaises(ValueError):
+                parse_qid_list(f"Q1,{invalid}")
+        with self.assertRaisesRegex(ValueError, "Invalid entity IDs 'X1', 'Q0'"):
+            parse_qid_list("Q1,X1,Q2,Q0")
+
     def test_resolve_qids_rejects_multiple_selectors(self) -> None:
         with self.assertRaises(ValueError):
             resolve_qids("Q42", None, 2)
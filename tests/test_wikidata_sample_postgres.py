@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+
+from src.wikidata_sample_postgres import (
+    DEFAULT_FETCH_BATCH_SIZE,
+    DEFAULT_SUPPORT_BREAKER_FAIL_THRESHOLD,
+    DEFAULT_SUPPORT_BREAKER_WINDOW_SECONDS,
+    DEFAULT_SUPPORT_RATE_LIMIT_ABORT_THRESHOLD,
+    FetchResult,
+    _SupportPrefetchThrottle,
+)
+
+
+def _failed_batch(http_status: int, *, size: int = DEFAULT_FETCH_BATCH_SIZE) -> list[FetchResult]:
+    return [
+        FetchResult(qid=f"Q{index}", status="error", source_url="", error="HTTP", http_status=http_status)
+        for index in range(1, size + 1)
+    ]
+
+
+def _support_throttle() -> _SupportPrefetchThrottle:
+    return _SupportPrefetchThrottle(
+        rate_limit_abort_threshold=DEFAULT_SUPPORT_RATE_LIMIT_ABORT_THRESHOLD,
+        fail_threshold=DEFAULT_SUPPORT_BREAKER_FAIL_THRESHOLD,
+        window_seconds=DEFAULT_SUPPORT_BREAKER_WINDOW_SECONDS,
+    )
+
+
+class SupportPrefetchThrottleTests(unittest.TestCase):
+    def test_one_failed_batch_does_not_abort_prefetch(self) -> None:
+        for http_status in (429, 503):
+            throttle = _support_throttle()
+            throttle.record_request(_failed_batch(http_status))
+            self.assertFalse(throttle.should_abort())
+            self.assertEqual(throttle.rate_limited_requests, 1 if http_status == 429 else 0)
+
+    def test_repeated_failed_requests_abort_prefetch(self) -> None:
+        throttle = _support_throttle()
+        throttle.record_request(_failed_batch(404))
+        for _ in range(DEFAULT_SUPPORT_BREAKER_FAIL_THRESHOLD - 1):
+            throttle.record_request(_failed_batch(502))
+        self.assertFalse(throttle.should_abort())
+
+        throttle.record_request(_failed_batch(429))
+        self.assertTrue(throttle.should_abort())
+
+
+if __name__ == "__main__":
+    unittest.main()